@@ -1,8 +1,13 @@
 """
 FastAPI 의존성 - 인증 및 공통 의존성
 """
+import hashlib
+import time
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from jose import jwt, JWTError
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from typing import Optional
 
@@ -14,6 +19,45 @@ from app.repositories import UserRepository
 # HTTP Bearer 토큰 스키마
 security = HTTPBearer(auto_error=False)
 
+# 검증된 토큰 캐시 (토큰 해시 -> 사용자 정보)
+TOKEN_CACHE_TTL = 60
+_token_cache: TTLCache = TTLCache(maxsize=10000, ttl=TOKEN_CACHE_TTL)
+
+
+def _token_cache_key(token: str) -> bytes:
+    """토큰 원문 대신 해시를 캐시 키로 사용합니다."""
+    return hashlib.blake2s(token.encode(), digest_size=16).digest()
+
+
+def _remaining_lifetime(token: str) -> float:
+    """토큰 만료까지 남은 시간(초)을 반환합니다. 확인할 수 없으면 0."""
+    try:
+        exp = jwt.get_unverified_claims(token).get("exp")
+    except JWTError:
+        return 0
+    if not exp:
+        return 0
+    return exp - time.time()
+
+
+async def _resolve_user(token: str, cognito: CognitoService) -> Optional[UserInfo]:
+    """
+    토큰으로 사용자 정보를 가져옵니다.
+    성공한 결과만 캐시하며, 캐시 TTL보다 먼저 만료되는 토큰은 캐시하지 않습니다.
+    """
+    key = _token_cache_key(token)
+    user_info = _token_cache.get(key)
+    if user_info is not None:
+        return user_info
+    
+    # boto3 호출이 이벤트 루프를 막지 않도록 스레드풀에서 실행
+    user_info = await run_in_threadpool(cognito.get_user_info, token)
+    
+    if user_info and _remaining_lifetime(token) > TOKEN_CACHE_TTL:
+        _token_cache[key] = user_info
+    
+    return user_info
+
 
 async def get_current_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
@@ -42,7 +86,7 @@ async def get_current_user(
     token = credentials.credentials
     
     # 토큰으로 사용자 정보 가져오기
-    user_info = cognito.get_user_info(token)
+    user_info = await _resolve_user(token, cognito)
     
     if not user_info:
         raise HTTPException(
@@ -73,7 +117,7 @@ async def get_current_user_optional(
         return None
     
     token = credentials.credentials
-    user_info = cognito.get_user_info(token)
+    user_info = await _resolve_user(token, cognito)
     
     return user_info
 
@@ -1,12 +1,15 @@
 """
 Health Check Endpoint
 """
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Response
 
 router = APIRouter()
 
+_HEALTH_BODY = orjson.dumps({"status": "healthy", "service": "weekly-report"})
+
 
 @router.get("/health")
 async def health():
     """헬스체크 엔드포인트"""
-    return {"status": "healthy", "service": "weekly-report"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
@@ -3,12 +3,18 @@
 Fproject-agent 패턴에 맞춘 엔드포인트 구조
 """
 import logging
-from datetime import date, datetime
-from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Query
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional, Dict, Any
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Query, Request, Response
+from fastapi.responses import ORJSONResponse, RedirectResponse
 from sqlalchemy.orm import Session
 
 from app.config.database import get_db, SessionLocal
+from app.config.settings import get_settings
 from app.api.schemas import (
     CreateReportRequest,
     CreateReportResponse,
@@ -18,8 +24,8 @@ from app.api.schemas import (
 )
 from app.services.cognito_service import get_cognito_service, CognitoService
 from app.services.strands_service import get_strands_service, StrandsAgentService, StrandsServiceError
-from app.services.report_service import ReportAnalysisService
-from app.services.email_service import get_email_service, EmailService
+from app.services.report_service import get_report_service
+from app.services.email_service import get_email_service
 from app.services.s3_service import get_s3_service, S3Service, S3ServiceError
 from app.repositories import HistoryRepository, UserRepository, ReportRepository
 
@@ -27,6 +33,129 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# 리포트 생성(에이전트 호출에 최대 수 분 소요)은 Starlette 공용 스레드풀이 아닌 전용 실행기에서 처리
+# 생성 요청이 몰려도 대기 작업은 이 실행기의 큐에 쌓이고, 다른 엔드포인트가 쓸 스레드는 남겨 둠
+# 작업자 수가 곧 에이전트 동시 호출 수 제한 (에이전트/모델 스로틀링 방지)
+_report_executor = ThreadPoolExecutor(
+    max_workers=get_settings().AGENT_CONCURRENCY,
+    thread_name_prefix="report-worker"
+)
+
+# 엔드포인트와 백그라운드 작업이 스레드풀에서 실행되므로 캐시 접근은 잠금으로 보호
+_cache_lock = threading.Lock()
+
+# 완료된 리포트는 더 이상 변경되지 않으므로 프로세스 내에 잠시 캐시
+REPORT_CACHE_TTL = 300
+_completed_report_cache: TTLCache = TTLCache(maxsize=1024, ttl=REPORT_CACHE_TTL)
+_report_file_cache: TTLCache = TTLCache(maxsize=256, ttl=REPORT_CACHE_TTL)
+
+# Presigned URL은 1시간 유효하므로 최소 5분 이상 유효 기간이 남아 있을 때까지 재사용
+PRESIGNED_URL_EXPIRATION = 3600
+_presigned_url_cache: TTLCache = TTLCache(maxsize=4096, ttl=PRESIGNED_URL_EXPIRATION - 300)
+
+# 닉네임 검색: 닉네임 -> 사용자 확인 결과, 닉네임 -> 최근 리포트 요약
+NICKNAME_CACHE_TTL = 60
+NICKNAME_REPORT_CACHE_TTL = 30
+_nickname_user_cache: TTLCache = TTLCache(maxsize=10000, ttl=NICKNAME_CACHE_TTL)
+_nickname_report_cache: TTLCache = TTLCache(maxsize=10000, ttl=NICKNAME_REPORT_CACHE_TTL)
+
+# 같은 기간 리포트 재요청을 중복으로 보는 시간 (분)
+DUPLICATE_REPORT_WINDOW_MINUTES = 10
+
+
+def _cache_get(cache: TTLCache, key: Any) -> Any:
+    """캐시에서 값을 꺼냅니다 (없으면 None)."""
+    with _cache_lock:
+        return cache.get(key)
+
+
+def _cache_set(cache: TTLCache, key: Any, value: Any) -> None:
+    """캐시에 값을 저장합니다."""
+    with _cache_lock:
+        cache[key] = value
+
+
+def _get_report_dict(db: Session, report_id: int, user_id: str) -> Dict[str, Any]:
+    """
+    리포트를 조회하고 소유자를 확인합니다.
+    완료된 리포트는 캐시에서 반환하고, 처리 중인 리포트는 항상 DB에서 조회합니다.
+    """
+    report_dict = _cache_get(_completed_report_cache, report_id)
+    if report_dict is None:
+        report = ReportRepository(db).get_report_by_id(report_id)
+        
+        if not report:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="리포트를 찾을 수 없습니다"
+            )
+        
+        report_dict = report.to_dict()
+        if report_dict["status"] == "completed":
+            _cache_set(_completed_report_cache, report_id, report_dict)
+    
+    if report_dict["user_id"] != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="다른 사용자의 리포트에 접근할 수 없습니다"
+        )
+    
+    return report_dict
+
+
+def _nickname_user_exists(nickname: str, cognito: CognitoService, db: Session) -> bool:
+    """
+    닉네임에 해당하는 사용자가 있는지 Cognito, DB 순서로 확인합니다.
+    존재하는 경우에만 캐시하여 새로 가입한 사용자가 조회되지 않는 일이 없도록 합니다.
+    """
+    if _cache_get(_nickname_user_cache, nickname):
+        return True
+    
+    exists = (
+        cognito.get_user_by_nickname(nickname) is not None
+        or UserRepository(db).get_user_by_nickname(nickname) is not None
+    )
+    if exists:
+        _cache_set(_nickname_user_cache, nickname, True)
+    return exists
+
+
+def _invalidate_nickname_report(nickname: str) -> None:
+    """닉네임의 최근 리포트 요약 캐시를 비웁니다."""
+    with _cache_lock:
+        _nickname_report_cache.pop(nickname, None)
+
+
+def _get_presigned_url(s3_service: S3Service, s3_key: str) -> tuple:
+    """캐시된 presigned URL과 만료 시각을 반환하고, 없으면 새로 서명합니다."""
+    cached = _cache_get(_presigned_url_cache, s3_key)
+    if cached is None:
+        try:
+            download_url = s3_service.generate_presigned_url(
+                s3_key, expiration=PRESIGNED_URL_EXPIRATION
+            )
+        except S3ServiceError as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=str(e)
+            )
+        cached = (download_url, time.time() + PRESIGNED_URL_EXPIRATION)
+        _cache_set(_presigned_url_cache, s3_key, cached)
+    return cached
+
+
+def _report_etag(report_dict: Dict[str, Any]) -> str:
+    """리포트 ID와 생성 시각으로 ETag를 만듭니다."""
+    return f'"{report_dict["id"]}-{report_dict["created_at"]}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 확인합니다."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    return etag in (tag.strip() for tag in if_none_match.split(","))
+
 
 def _process_report_background(
     report_id: int,
@@ -37,14 +166,18 @@ def _process_report_background(
     week_end: date,
     entry_dicts: list,
 ):
-    """백그라운드에서 리포트 생성 처리"""
-    db = SessionLocal()
+    """백그라운드에서 리포트 생성 처리
+    
+    분석/S3/SES 호출 중에는 DB 커넥션을 잡지 않고, 결과 저장 시점에만 세션을 엽니다.
+    """
+    week_start_iso = week_start.isoformat()
+    week_end_iso = week_end.isoformat()
+    
     try:
         strands = get_strands_service()
-        report_service = ReportAnalysisService()
-        report_repo = ReportRepository(db)
-        s3_service = S3Service()
-        email_service = EmailService()
+        report_service = get_report_service()
+        s3_service = get_s3_service()
+        email_service = get_email_service()
         
         logger.info(f"백그라운드 리포트 생성 시작: report_id={report_id}")
         
@@ -53,8 +186,8 @@ def _process_report_background(
             entries=entry_dicts,
             nickname=nickname,
             user_id=user_id,
-            start_date=week_start.isoformat(),
-            end_date=week_end.isoformat()
+            start_date=week_start_iso,
+            end_date=week_end_iso
         )
         
         # 리포트 생성
@@ -67,20 +200,25 @@ def _process_report_background(
             analysis=analysis
         )
         
-        # 현재 시간
-        created_at = datetime.utcnow()
+        # 현재 시간 (UTC, ISO 문자열은 한 번만 생성)
+        created_at = datetime.now(timezone.utc)
+        created_at_iso = created_at.isoformat()
+        
+        # S3 저장과 DB 업데이트에 같은 직렬화 결과를 재사용
+        daily_dicts = [d.to_dict() for d in report_result.daily_analysis]
+        pattern_dicts = [p.to_dict() for p in report_result.patterns]
         
         # S3에 리포트 저장
         report_data_for_s3 = {
             "nickname": report_result.nickname,
-            "week_start": report_result.week_start.isoformat(),
-            "week_end": report_result.week_end.isoformat(),
+            "week_start": week_start_iso,
+            "week_end": week_end_iso,
             "average_score": report_result.average_score,
             "evaluation": report_result.evaluation,
-            "daily_analysis": [d.to_dict() for d in report_result.daily_analysis],
-            "patterns": [p.to_dict() for p in report_result.patterns],
+            "daily_analysis": daily_dicts,
+            "patterns": pattern_dicts,
             "feedback": report_result.feedback,
-            "created_at": created_at.isoformat()
+            "created_at": created_at_iso
         }
         
         s3_key = None
@@ -94,18 +232,20 @@ def _process_report_background(
             logger.warning(f"S3 업로드 실패: {e}")
         
         # DB 업데이트
-        report_repo.update_report(
-            report_id=report_id,
-            average_score=report_result.average_score,
-            evaluation=report_result.evaluation,
-            daily_analysis=[d.to_dict() for d in report_result.daily_analysis],
-            patterns=[p.to_dict() for p in report_result.patterns],
-            feedback=report_result.feedback,
-            s3_key=s3_key,
-            status="completed"
-        )
+        with SessionLocal() as db:
+            ReportRepository(db).update_report(
+                report_id=report_id,
+                average_score=report_result.average_score,
+                evaluation=report_result.evaluation,
+                daily_analysis=daily_dicts,
+                patterns=pattern_dicts,
+                feedback=report_result.feedback,
+                s3_key=s3_key,
+                status="completed"
+            )
+        _invalidate_nickname_report(nickname)
         
-        # 이메일 발송
+        # 완료 상태가 저장된 뒤에만 알림 발송 (저장 실패 시 '완료' 메일이 나가지 않도록)
         try:
             email_service.send_report_notification(email, report_result)
         except Exception as e:
@@ -116,16 +256,27 @@ def _process_report_background(
     except Exception as e:
         logger.error(f"백그라운드 리포트 생성 실패: report_id={report_id}, error={e}")
         try:
-            report_repo = ReportRepository(db)
-            report_repo.update_report_status(report_id, "failed", str(e))
-        except:
-            pass
-    finally:
-        db.close()
+            with SessionLocal() as db:
+                ReportRepository(db).update_report_status(report_id, "failed", str(e))
+        except Exception as db_error:
+            logger.error(f"리포트 실패 상태 저장 실패: report_id={report_id}, error={db_error}")
+
+
+def _log_report_job_error(future: Future) -> None:
+    """실행기 작업에서 처리되지 않은 예외가 조용히 사라지지 않도록 로그로 남김"""
+    error = future.exception()
+    if error is not None:
+        logger.error("백그라운드 리포트 작업 예외", exc_info=error)
+
+
+def _submit_report_job(*args) -> None:
+    """리포트 생성 작업을 전용 실행기에 넘기고 예외 로그 콜백을 등록"""
+    future = _report_executor.submit(_process_report_background, *args)
+    future.add_done_callback(_log_report_job_error)
 
 
 @router.post("/create")
-async def create_report(
+def create_report(
     request: CreateReportRequest,
     background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
@@ -137,16 +288,10 @@ async def create_report(
     - 즉시 report_id와 status="processing"을 반환합니다.
     - GET /report/{report_id}로 완료 여부를 확인할 수 있습니다.
     """
-    if not request.user_id:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="user_id는 필수입니다"
-        )
-    
     history_repo = HistoryRepository(db)
     user_repo = UserRepository(db)
     report_repo = ReportRepository(db)
-    report_service = ReportAnalysisService()
+    report_service = get_report_service()
     
     user = user_repo.get_user_by_id(request.user_id)
     if not user:
@@ -170,26 +315,37 @@ async def create_report(
             detail="시작일이 종료일보다 늦을 수 없습니다"
         )
     
-    entries = history_repo.get_entries_by_user_and_period(
+    # 같은 기간 리포트가 최근에 요청되었으면 새로 분석하지 않고 기존 리포트를 반환
+    recent_report = report_repo.get_recent_report_for_week(
+        request.user_id,
+        week_start,
+        week_end,
+        since=datetime.utcnow() - timedelta(minutes=DUPLICATE_REPORT_WINDOW_MINUTES)
+    )
+    if recent_report:
+        return {
+            "report_id": recent_report.id,
+            "user_id": recent_report.user_id,
+            "nickname": recent_report.nickname,
+            "status": recent_report.status or "completed",
+            "message": "같은 기간의 리포트가 이미 요청되었습니다. 기존 리포트를 확인해주세요.",
+            "week_period": {
+                "start": week_start.isoformat(),
+                "end": week_end.isoformat()
+            },
+            "created_at": recent_report.created_at.isoformat()
+        }
+    
+    entry_dicts = history_repo.get_entry_dicts_by_user_and_period(
         request.user_id, week_start, week_end
     )
     
-    if not entries:
+    if not entry_dicts:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"분석 기간({week_start} ~ {week_end})에 일기가 없습니다"
         )
     
-    entry_dicts = [
-        {
-            "id": e.id,
-            "content": e.content,
-            "record_date": e.record_date,
-            "tags": e.tags or []
-        }
-        for e in entries
-    ]
-    
     saved_report = report_repo.save_report(
         user_id=request.user_id,
         nickname=nickname,
@@ -203,9 +359,11 @@ async def create_report(
         s3_key=None,
         status="processing"
     )
+    _invalidate_nickname_report(nickname)
     
+    # 응답 전송 후 전용 실행기에 작업만 넘김 (공용 스레드풀 점유 없음)
     background_tasks.add_task(
-        _process_report_background,
+        _submit_report_job,
         saved_report.id,
         request.user_id,
         nickname,
@@ -230,14 +388,14 @@ async def create_report(
 
 
 @router.get("/status/{report_id}")
-async def get_report_status(
+def get_report_status(
     report_id: int,
     user_id: str = Query(..., description="사용자 ID"),
     db: Session = Depends(get_db),
 ):
     """리포트 생성 상태를 조회합니다."""
     report_repo = ReportRepository(db)
-    report = report_repo.get_report_by_id(report_id)
+    report = report_repo.get_report_status_row(report_id)
     
     if not report:
         raise HTTPException(
@@ -251,53 +409,42 @@ async def get_report_status(
             detail="다른 사용자의 리포트에 접근할 수 없습니다"
         )
     
-    return {
+    return ORJSONResponse({
         "report_id": report.id,
-        "status": getattr(report, 'status', 'completed'),
+        "status": report.status or "completed",
         "created_at": report.created_at.isoformat()
-    }
+    })
 
 
-@router.get("/search/{nickname}", response_model=ReportSummaryResponse)
-async def get_report_by_nickname(
+@router.get("/search/{nickname}", responses={200: {"model": ReportSummaryResponse}})
+def get_report_by_nickname(
     nickname: str,
     db: Session = Depends(get_db),
     cognito: CognitoService = Depends(get_cognito_service),
 ):
     """닉네임으로 가장 최근 리포트 요약을 조회합니다."""
-    user_info = cognito.get_user_by_nickname(nickname)
-    
-    if not user_info:
-        user_repo = UserRepository(db)
-        db_user = user_repo.get_user_by_nickname(nickname)
+    cached = _cache_get(_nickname_report_cache, nickname)
+    if cached is None:
+        # 리포트가 있으면 사용자 존재가 확인된 것이므로 Cognito/사용자 조회는 리포트가 없을 때만 수행
+        report_repo = ReportRepository(db)
+        report = report_repo.get_report_summary_by_nickname(nickname)
         
-        if not db_user:
+        if not report:
+            if not _nickname_user_exists(nickname, cognito, db):
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"닉네임 '{nickname}'에 해당하는 사용자를 찾을 수 없습니다"
+                )
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"닉네임 '{nickname}'에 해당하는 사용자를 찾을 수 없습니다"
+                detail=f"'{nickname}'님의 주간 리포트가 없습니다"
             )
-    
-    report_repo = ReportRepository(db)
-    report = report_repo.get_report_by_nickname(nickname)
-    
-    if not report:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"'{nickname}'님의 주간 리포트가 없습니다"
-        )
-    
-    diary_contents = [
-        d.get("diary_content", "") for d in report.daily_analysis
-    ]
-    
-    return ReportSummaryResponse(
-        report_id=report.id,
-        nickname=report.nickname,
-        created_at=report.created_at.isoformat(),
-        summary={
-            "diary_content": diary_contents,
-            "current_date": datetime.now().isoformat(),
-            "author_nickname": report.nickname,
+        
+        cached = {
+            "report_id": report.id,
+            "nickname": report.nickname,
+            "created_at": report.created_at.isoformat(),
+            "diary_content": report.diary_contents or [],
             "average_score": float(report.average_score),
             "evaluation": report.evaluation,
             "week_period": {
@@ -305,131 +452,156 @@ async def get_report_by_nickname(
                 "end": report.week_end.isoformat()
             }
         }
-    )
+        _cache_set(_nickname_report_cache, nickname, cached)
+    
+    # ReportSummaryResponse 형식의 딕셔너리를 모델 검증 없이 바로 직렬화
+    return ORJSONResponse({
+        "report_id": cached["report_id"],
+        "nickname": cached["nickname"],
+        "created_at": cached["created_at"],
+        "summary": {
+            "diary_content": cached["diary_content"],
+            "current_date": datetime.now().isoformat(),
+            "author_nickname": cached["nickname"],
+            "average_score": cached["average_score"],
+            "evaluation": cached["evaluation"],
+            "week_period": cached["week_period"]
+        }
+    })
 
 
 @router.get("/{report_id}")
-async def get_report_by_id(
+def get_report_by_id(
     report_id: int,
+    request: Request,
+    response: Response,
     user_id: str = Query(..., description="사용자 ID"),
     db: Session = Depends(get_db),
 ):
     """리포트 ID로 상세 리포트를 조회합니다."""
-    report_repo = ReportRepository(db)
-    report = report_repo.get_report_by_id(report_id)
+    report_dict = _get_report_dict(db, report_id, user_id)
     
-    if not report:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="리포트를 찾을 수 없습니다"
-        )
+    if report_dict["status"] == "completed":
+        etag = _report_etag(report_dict)
+        if _etag_matches(request, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        response.headers["ETag"] = etag
     
-    if report.user_id != user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="다른 사용자의 리포트에 접근할 수 없습니다"
-        )
-    
-    return report.to_dict()
+    return report_dict
 
 
 @router.get("/")
-async def get_my_reports(
+def get_my_reports(
     user_id: str = Query(..., description="사용자 ID"),
-    limit: int = Query(10, description="조회할 개수"),
+    limit: int = Query(10, ge=1, le=100, description="조회할 개수"),
+    before: Optional[datetime] = Query(None, description="이 시각 이전 리포트 조회 (이전 응답의 next_before)"),
+    before_id: Optional[int] = Query(None, description="이전 응답의 next_before_id"),
     db: Session = Depends(get_db),
 ):
-    """내 리포트 목록을 조회합니다."""
+    """
+    내 리포트 목록을 조회합니다.
+    
+    - 목록에는 요약 필드만 포함됩니다. 상세 내용은 GET /report/{report_id}로 조회합니다.
+    - 다음 페이지는 응답의 next_before, next_before_id 값을 before, before_id로 전달하여 조회합니다.
+    """
     report_repo = ReportRepository(db)
-    reports = report_repo.get_reports_by_user(user_id, limit)
+    reports = report_repo.get_report_summaries_by_user(user_id, limit, before, before_id)
+    has_next = bool(reports) and len(reports) == limit
     
     return {
-        "reports": [r.to_dict() for r in reports],
-        "total": len(reports)
+        "reports": [
+            {
+                "id": r.id,
+                "user_id": r.user_id,
+                "nickname": r.nickname,
+                "week_start": r.week_start.isoformat(),
+                "week_end": r.week_end.isoformat(),
+                "average_score": float(r.average_score),
+                "evaluation": r.evaluation,
+                "status": r.status or "completed",
+                "created_at": r.created_at.isoformat(),
+            }
+            for r in reports
+        ],
+        "total": len(reports),
+        "next_before": reports[-1].created_at.isoformat() if has_next else None,
+        "next_before_id": reports[-1].id if has_next else None
     }
 
 
 @router.get("/{report_id}/file")
-async def get_report_file(
+def get_report_file(
     report_id: int,
+    request: Request,
+    response: Response,
     user_id: str = Query(..., description="사용자 ID"),
+    redirect: bool = Query(False, description="true면 S3 presigned URL로 리다이렉트"),
     db: Session = Depends(get_db),
     s3_service: S3Service = Depends(get_s3_service),
 ):
-    """리포트 파일(S3)을 조회합니다."""
-    report_repo = ReportRepository(db)
-    report = report_repo.get_report_by_id(report_id)
-    
-    if not report:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="리포트를 찾을 수 없습니다"
-        )
+    """
+    리포트 파일(S3)을 조회합니다.
     
-    if report.user_id != user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="다른 사용자의 리포트에 접근할 수 없습니다"
-        )
+    - redirect=true이면 파일 내용을 서버를 거쳐 전달하지 않고 S3로 직접 리다이렉트합니다.
+    """
+    report_dict = _get_report_dict(db, report_id, user_id)
+    s3_key = report_dict["s3_key"]
     
-    if not report.s3_key:
+    if not s3_key:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="리포트 파일이 존재하지 않습니다"
         )
     
-    try:
-        content = s3_service.get_report(report.s3_key)
-        return {
-            "report_id": report_id,
-            "s3_key": report.s3_key,
-            "content": content
-        }
-    except S3ServiceError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
+    if redirect:
+        download_url, _ = _get_presigned_url(s3_service, s3_key)
+        return RedirectResponse(download_url, status_code=status.HTTP_307_TEMPORARY_REDIRECT)
+    
+    etag = _report_etag(report_dict)
+    if _etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    
+    # 같은 사용자가 같은 날 만든 리포트는 S3 키가 같을 수 있으므로 리포트 ID와 함께 캐시
+    cache_key = (report_id, s3_key)
+    content = _cache_get(_report_file_cache, cache_key)
+    if content is None:
+        try:
+            content = s3_service.get_report(s3_key)
+        except S3ServiceError as e:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=str(e)
+            )
+        _cache_set(_report_file_cache, cache_key, content)
+    
+    response.headers["ETag"] = etag
+    return {
+        "report_id": report_id,
+        "s3_key": s3_key,
+        "content": content
+    }
 
 
 @router.get("/{report_id}/download-url")
-async def get_report_download_url(
+def get_report_download_url(
     report_id: int,
     user_id: str = Query(..., description="사용자 ID"),
     db: Session = Depends(get_db),
     s3_service: S3Service = Depends(get_s3_service),
 ):
     """리포트 파일 다운로드 URL을 생성합니다."""
-    report_repo = ReportRepository(db)
-    report = report_repo.get_report_by_id(report_id)
+    report_dict = _get_report_dict(db, report_id, user_id)
+    s3_key = report_dict["s3_key"]
     
-    if not report:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="리포트를 찾을 수 없습니다"
-        )
-    
-    if report.user_id != user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="다른 사용자의 리포트에 접근할 수 없습니다"
-        )
-    
-    if not report.s3_key:
+    if not s3_key:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="리포트 파일이 존재하지 않습니다"
         )
     
-    try:
-        download_url = s3_service.generate_presigned_url(report.s3_key)
-        return {
-            "report_id": report_id,
-            "download_url": download_url,
-            "expires_in": 3600
-        }
-    except S3ServiceError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    download_url, expires_at = _get_presigned_url(s3_service, s3_key)
+    return {
+        "report_id": report_id,
+        "download_url": download_url,
+        "expires_in": int(expires_at - time.time())
+    }
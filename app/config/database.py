@@ -1,7 +1,7 @@
 """
 데이터베이스 연결 설정
 """
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, Session
 from typing import Generator
 
@@ -13,12 +13,28 @@ settings = get_settings()
 engine = create_engine(
     settings.get_database_url(),
     pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    # 최근 사용한 커넥션을 우선 재사용하여 유휴 커넥션이 자연스럽게 정리되도록 함
+    pool_use_lifo=True,
+    connect_args={
+        "connect_timeout": settings.DB_CONNECT_TIMEOUT,
+        "application_name": settings.APP_NAME,
+    },
 )
 
+
+@event.listens_for(engine, "do_connect")
+def _set_current_password(dialect, conn_rec, cargs, cparams):
+    """새 커넥션을 만들 때마다 비밀번호를 다시 읽어 교체(rotation)된 시크릿을 재시작 없이 반영"""
+    cparams["password"] = settings.get_database_password()
+
+
 # 세션 팩토리
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# commit 후 객체를 만료시키지 않아 응답 생성 시 추가 SELECT가 발생하지 않도록 함
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -3,19 +3,28 @@ AWS Secrets Manager에서 애플리케이션 설정을 가져오는 모듈
 """
 import json
 import logging
+import threading
 import boto3
+from cachetools import TTLCache
 from functools import lru_cache
 from typing import Optional, Dict, Any
 
 logger = logging.getLogger(__name__)
 
+# 교체(rotation)된 시크릿이 반영되도록 1시간 후 다시 조회
+SECRET_CACHE_TTL = 3600
+# 존재하지 않는 시크릿은 5분 동안 다시 조회하지 않음
+MISSING_SECRET_TTL = 300
+
 
 class SecretsManager:
     """AWS Secrets Manager 클라이언트"""
     
     def __init__(self, region_name: str = "us-east-1"):
         self.client = boto3.client("secretsmanager", region_name=region_name)
-        self._cache: Dict[str, Any] = {}
+        self._cache: TTLCache = TTLCache(maxsize=128, ttl=SECRET_CACHE_TTL)
+        self._missing: TTLCache = TTLCache(maxsize=128, ttl=MISSING_SECRET_TTL)
+        self._lock = threading.Lock()
     
     def get_secret(self, secret_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -27,10 +36,18 @@ class SecretsManager:
         Returns:
             시크릿 값 (JSON 파싱된 딕셔너리) 또는 None
         """
-        # 캐시 확인
-        if secret_name in self._cache:
-            return self._cache[secret_name]
+        with self._lock:
+            # 캐시 확인 (없는 시크릿도 잠시 기억)
+            if secret_name in self._cache:
+                return self._cache[secret_name]
+            if secret_name in self._missing:
+                return None
         
+        # 네트워크 조회는 잠금 밖에서 수행하여 다른 시크릿 조회를 막지 않음
+        return self._fetch_secret(secret_name)
+    
+    def _fetch_secret(self, secret_name: str) -> Optional[Dict[str, Any]]:
+        """Secrets Manager에서 시크릿을 조회하여 캐시에 저장합니다."""
         try:
             response = self.client.get_secret_value(SecretId=secret_name)
             secret_string = response.get("SecretString")
@@ -47,16 +64,30 @@ class SecretsManager:
                 secret_data = {"value": secret_string}
             
             # 캐시에 저장
-            self._cache[secret_name] = secret_data
+            with self._lock:
+                self._cache[secret_name] = secret_data
             return secret_data
             
         except self.client.exceptions.ResourceNotFoundException:
             logger.error(f"Secret {secret_name} not found")
+            with self._lock:
+                self._missing[secret_name] = True
             return None
         except Exception as e:
             logger.error(f"Failed to get secret {secret_name}: {e}")
             return None
     
+    def invalidate(self, secret_name: str) -> None:
+        """
+        캐시된 시크릿을 제거하여 다음 조회 시 다시 가져오도록 합니다.
+        
+        Args:
+            secret_name: 시크릿 이름
+        """
+        with self._lock:
+            self._cache.pop(secret_name, None)
+            self._missing.pop(secret_name, None)
+    
     def get_secret_value(self, secret_name: str, key: str, default: Any = None) -> Any:
         """
         Secrets Manager에서 특정 키의 값을 가져옵니다.
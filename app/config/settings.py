@@ -3,31 +3,14 @@
 AWS Secrets Manager에서 DB 정보를 가져오고 환경 변수를 관리합니다.
 """
 import os
-import json
 import logging
-import boto3
 from functools import lru_cache
 from pydantic_settings import BaseSettings
-from typing import Optional
-
-logger = logging.getLogger(__name__)
+from typing import List, Optional
 
+from app.config.secrets import get_secrets_manager
 
-def get_secret(secret_name: str, region_name: str = "us-east-1") -> dict:
-    """AWS Secrets Manager에서 시크릿 값을 가져옵니다."""
-    try:
-        client = boto3.client("secretsmanager", region_name=region_name)
-        response = client.get_secret_value(SecretId=secret_name)
-        secret_string = response["SecretString"]
-        # JSON 형식인 경우 파싱
-        try:
-            return json.loads(secret_string)
-        except json.JSONDecodeError:
-            return {"password": secret_string}
-    except Exception as e:
-        logger.error(f"Secrets Manager에서 시크릿 가져오기 실패: {e}")
-        # 개발 환경에서는 에러를 발생시키지 않고 빈 딕셔너리 반환
-        return {}
+logger = logging.getLogger(__name__)
 
 
 class Settings(BaseSettings):
@@ -51,6 +34,11 @@ class Settings(BaseSettings):
     BEDROCK_FLOW_ALIAS_ID: Optional[str] = None
     BEDROCK_TIMEOUT: int = 300  # 5분 (Bedrock Flow는 1-2분 소요)
     
+    # Fproject-agent 동시 호출 수 제한 (에이전트/모델 스로틀링 방지)
+    AGENT_CONCURRENCY: int = 4
+    # 에이전트에 보내는 일기 본문 최대 길이 (초과 시 오래된 일기부터 제외)
+    AGENT_MAX_INPUT_CHARS: int = 20000
+    
     # 데이터베이스 설정 (Secrets Manager 미사용 시)
     DB_HOST: Optional[str] = None
     DB_PORT: int = 5432
@@ -58,6 +46,13 @@ class Settings(BaseSettings):
     DB_USER: Optional[str] = None
     DB_PASSWORD: Optional[str] = None
     
+    # 데이터베이스 커넥션 풀 설정
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800  # RDS 유휴 타임아웃보다 먼저 커넥션 재생성 (초)
+    DB_POOL_TIMEOUT: int = 30  # 풀이 가득 찼을 때 커넥션을 기다리는 최대 시간 (초)
+    DB_CONNECT_TIMEOUT: int = 5
+    
     # Cognito 설정 (환경 변수 또는 Secrets Manager에서)
     COGNITO_USER_POOL_ID: Optional[str] = None
     COGNITO_CLIENT_ID: Optional[str] = None
@@ -68,6 +63,17 @@ class Settings(BaseSettings):
     # API 설정
     API_BASE_URL: str = "https://api.aws11.shop"
     
+    # CORS 허용 Origin (DEBUG 모드에서는 localhost가 추가로 허용됨)
+    CORS_ALLOWED_ORIGINS: List[str] = [
+        "https://aws11.shop",
+        "https://api.aws11.shop",
+        "https://www.aws11.shop",
+        "https://web.aws11.shop",
+    ]
+    
+    # OpenTelemetry 트레이싱 사용 여부
+    ENABLE_TRACING: bool = True
+    
     # 캐시된 설정
     _db_config: Optional[dict] = None
     _app_config: Optional[dict] = None
@@ -86,8 +92,8 @@ class Settings(BaseSettings):
         # Secrets Manager에서 가져오기 시도
         if self.USE_SECRETS_MANAGER:
             try:
-                secret = get_secret(self.APP_CONFIG_SECRET_NAME, self.AWS_REGION)
-                config = secret
+                secret = get_secrets_manager(self.AWS_REGION).get_secret(self.APP_CONFIG_SECRET_NAME)
+                config = dict(secret or {})
                 logger.info(f"Loaded app config from Secrets Manager: {self.APP_CONFIG_SECRET_NAME}")
             except Exception as e:
                 logger.warning(f"Failed to load app config from Secrets Manager: {e}")
@@ -114,16 +120,8 @@ class Settings(BaseSettings):
         password = self.DB_PASSWORD
         
         # Secrets Manager에서 비밀번호만 가져오기
-        if self.USE_SECRETS_MANAGER and not password:
-            try:
-                secret = get_secret(self.DB_SECRET_NAME, self.AWS_REGION)
-                # JSON이면 password 키에서, 아니면 전체 문자열이 비밀번호
-                if isinstance(secret, dict):
-                    password = secret.get("password", secret.get("SecretString", ""))
-                else:
-                    password = str(secret)
-            except Exception as e:
-                logger.warning(f"Secrets Manager에서 비밀번호 가져오기 실패: {e}")
+        if self._uses_secret_db_password():
+            password = self._get_secret_db_password()
         
         self._db_config = {
             "host": self.DB_HOST,
@@ -134,6 +132,31 @@ class Settings(BaseSettings):
         }
         return self._db_config
     
+    def _uses_secret_db_password(self) -> bool:
+        """DB 비밀번호를 Secrets Manager에서 가져오는지 여부"""
+        return self.USE_SECRETS_MANAGER and not self.DB_PASSWORD
+    
+    def _get_secret_db_password(self) -> str:
+        """Secrets Manager에서 DB 비밀번호를 가져옵니다."""
+        try:
+            secret = get_secrets_manager(self.AWS_REGION).get_secret(self.DB_SECRET_NAME) or {}
+            # JSON이면 password 키에서, 아니면 전체 문자열(value)이 비밀번호
+            return secret.get("password", secret.get("value", ""))
+        except Exception as e:
+            logger.warning(f"Secrets Manager에서 비밀번호 가져오기 실패: {e}")
+            return ""
+    
+    def get_database_password(self) -> str:
+        """
+        새 DB 커넥션에 사용할 비밀번호를 반환합니다.
+        Secrets Manager를 사용하면 시크릿 캐시(TTL)를 거쳐 다시 조회하므로 교체된 비밀번호가 반영됩니다.
+        조회에 실패하면 처음 가져온 비밀번호를 사용합니다.
+        """
+        config = self._get_db_config()
+        if self._uses_secret_db_password():
+            return self._get_secret_db_password() or config["password"]
+        return config["password"]
+    
     def get_database_url(self) -> str:
         """SQLAlchemy 데이터베이스 URL을 반환합니다."""
         config = self._get_db_config()
@@ -27,13 +27,14 @@ async def startup_handler():
         print(f"   - AWS Region: {settings.AWS_REGION}")
         print(f"   - Debug Mode: {settings.DEBUG}")
     except Exception as e:
-        print(f"⚠️  설정 로드 실패: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"⚠️  설정 로드 실패: {str(e)}")
     
-    # 데이터베이스 연결 확인
+    # 데이터베이스 연결 확인 (첫 요청 전에 커넥션을 미리 생성)
     try:
+        from sqlalchemy import text
         from app.config.database import engine
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
         print("✅ 데이터베이스 연결 준비 완료")
     except Exception as e:
         print(f"⚠️  데이터베이스 연결 실패: {str(e)}")
@@ -46,6 +47,21 @@ async def startup_handler():
     except Exception as e:
         print(f"⚠️  Strands Agent 서비스 로드 실패: {str(e)}")
     
+    # AWS 클라이언트 미리 생성 (파드 역할에 ListBucket/GetSendQuota 권한이 없으므로 API 호출은 하지 않음)
+    try:
+        from app.services.s3_service import get_s3_service
+        _services['s3'] = get_s3_service()
+        print("✅ S3 클라이언트 준비 완료")
+    except Exception as e:
+        print(f"⚠️  S3 클라이언트 준비 실패: {str(e)}")
+    
+    try:
+        from app.services.email_service import get_email_service
+        _services['email'] = get_email_service()
+        print("✅ SES 클라이언트 준비 완료")
+    except Exception as e:
+        print(f"⚠️  SES 클라이언트 준비 실패: {str(e)}")
+    
     print("=" * 80)
     print("🚀 초기화 완료")
     print("=" * 80)
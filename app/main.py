@@ -2,15 +2,23 @@
 FastAPI Application Entry Point
 Fproject-agent 패턴에 맞춘 메인 애플리케이션
 """
+import asyncio
+import logging
+import time
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Response, status
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy import text
 
 from app.config.settings import get_settings
+from app.config.database import engine
 from app.core.startup import startup_handler
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
 from app.api.router import router
 from app.tracing import setup_tracing
 
@@ -22,8 +30,9 @@ from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
 async def lifespan(app: FastAPI):
     """애플리케이션 라이프사이클 관리"""
     # Startup
-    setup_tracing("weekly-report")
-    HTTPXClientInstrumentor().instrument()
+    if settings.ENABLE_TRACING:
+        setup_tracing("weekly-report")
+        HTTPXClientInstrumentor().instrument()
     await startup_handler()
     yield
     # Shutdown (필요시 정리 로직 추가)
@@ -36,50 +45,106 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan,
+    # 리포트 응답(JSONB 필드 포함) 직렬화를 orjson으로 처리
+    default_response_class=ORJSONResponse,
 )
 
 
 # CORS 설정
-allowed_origins = [
-    "https://aws11.shop",
-    "https://api.aws11.shop",
-    "https://www.aws11.shop",
-    "https://web.aws11.shop",
-]
-
 # 개발 환경에서만 localhost 허용
-if settings.DEBUG:
-    allowed_origins.extend([
-        "http://localhost:3000",
-        "http://localhost:8000",
-    ])
+DEV_ORIGINS = frozenset({
+    "http://localhost:3000",
+    "http://localhost:8000",
+})
+
+# 시작 시 한 번만 계산 (CORSMiddleware가 요청마다 `origin in allow_origins`로 O(1) 조회)
+ALLOWED_ORIGINS = frozenset(settings.CORS_ALLOWED_ORIGINS) | (DEV_ORIGINS if settings.DEBUG else frozenset())
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=allowed_origins,
+    allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
     allow_headers=["Authorization", "Content-Type"],
+    max_age=86400,  # preflight 응답을 브라우저가 24시간 캐시
 )
 
 # Include routers
 app.include_router(router)
 
+# 트레이싱에서 제외할 URL (쉼표로 구분된 정규식, 전체 URL에 대해 검색됨)
+# K8s 프로브(/health, /health/live, /health/ready, /report/health)와 루트(/)는 스팬을 만들지 않음
+TRACING_EXCLUDED_URLS = r"/health(/live|/ready)?$,^https?://[^/]+/$"
+
 # FastAPI Instrumentor 적용
-FastAPIInstrumentor.instrument_app(app)
+if settings.ENABLE_TRACING:
+    FastAPIInstrumentor.instrument_app(app, excluded_urls=TRACING_EXCLUDED_URLS)
+
+
+# 고정 응답 본문은 시작 시 한 번만 직렬화 (프로브가 자주 호출하므로)
+_HEALTH_BODY = orjson.dumps({"status": "healthy", "service": settings.APP_NAME})
+_ROOT_BODY = orjson.dumps({
+    "service": settings.APP_NAME,
+    "version": settings.APP_VERSION,
+    "description": "주간 일기 분석 및 감정 리포트 서비스"
+})
 
 
 @app.get("/health")
 async def health_check():
     """헬스 체크 엔드포인트 (K8s liveness/readiness probe용)"""
-    return {"status": "healthy", "service": settings.APP_NAME}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
+
+
+@app.get("/health/live")
+async def liveness():
+    """Liveness probe - 프로세스가 응답 가능한지만 확인 (의존성 검사 없음)"""
+    return Response(content=_HEALTH_BODY, media_type="application/json")
+
+
+# Readiness 검사 결과 캐시 (프로브 빈도와 관계없이 DB 검사는 10초에 한 번만 수행)
+READINESS_CACHE_TTL = 10
+_readiness_lock = asyncio.Lock()
+_readiness_cache = None  # (status_code, body, expires_at)
+
+
+def _check_database() -> dict:
+    """DB에 SELECT 1을 실행하고 결과와 지연 시간을 반환합니다."""
+    started = time.perf_counter()
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        return {"status": "ok", "latency_ms": round((time.perf_counter() - started) * 1000, 1)}
+    except Exception as e:
+        logger.warning(f"Readiness DB 검사 실패: {e}")
+        return {"status": "error", "error": type(e).__name__}
+
+
+@app.get("/health/ready")
+async def readiness():
+    """Readiness probe - DB 연결을 확인하고 결과를 10초간 캐시합니다."""
+    global _readiness_cache
+    
+    async with _readiness_lock:
+        now = time.monotonic()
+        if _readiness_cache is None or _readiness_cache[2] <= now:
+            # 리포트 엔드포인트가 쓰는 Starlette 공용 스레드풀이 아닌 이벤트 루프 기본 실행기에서 검사
+            loop = asyncio.get_running_loop()
+            database = await loop.run_in_executor(None, _check_database)
+            ready = database["status"] == "ok"
+            body = orjson.dumps({
+                "status": "ready" if ready else "not_ready",
+                "service": settings.APP_NAME,
+                "checks": {"database": database},
+            })
+            status_code = status.HTTP_200_OK if ready else status.HTTP_503_SERVICE_UNAVAILABLE
+            _readiness_cache = (status_code, body, time.monotonic() + READINESS_CACHE_TTL)
+        status_code, body, _ = _readiness_cache
+    
+    return Response(content=body, status_code=status_code, media_type="application/json")
 
 
 @app.get("/")
 async def root():
     """루트 엔드포인트"""
-    return {
-        "service": settings.APP_NAME,
-        "version": settings.APP_VERSION,
-        "description": "주간 일기 분석 및 감정 리포트 서비스"
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
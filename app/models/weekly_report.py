@@ -3,7 +3,7 @@ WeeklyReport 모델 - 주간 리포트 테이블 (신규 생성)
 """
 from datetime import date, datetime
 from typing import List, Dict, Any, Optional
-from sqlalchemy import Integer, String, Date, DateTime, Numeric, CheckConstraint, Text
+from sqlalchemy import Integer, String, Date, DateTime, Numeric, CheckConstraint, Text, Index, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -42,15 +42,38 @@ class WeeklyReport(Base):
     feedback: Mapped[List[str]] = mapped_column(JSONB, nullable=False)
     s3_key: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     status: Mapped[Optional[str]] = mapped_column(String(20), nullable=True, default="completed")
+    # 앱에서 UTC(naive)로 기록: 커서/중복 확인이 datetime.utcnow()와 비교하며,
+    # server_default=func.now()는 세션 타임존을 따르고 SQLite 테스트 DB에서는 초 단위라 정렬이 겹침
     created_at: Mapped[datetime] = mapped_column(
         DateTime, nullable=False, default=datetime.utcnow
     )
     
+    # 운영 DB에는 infra/weekly-reports-indexes.sql로 인덱스를 생성
     __table_args__ = (
         CheckConstraint(
             "evaluation IN ('positive', 'negative')",
             name="check_evaluation_type"
         ),
+        # 닉네임 검색 시 최신 리포트 1건을 정렬 없이 인덱스에서 바로 조회
+        Index(
+            "ix_weekly_reports_nickname_created_at",
+            "nickname",
+            text("created_at DESC")
+        ),
+        # 사용자별 리포트 목록(최신순, 키셋 페이지네이션) 조회용
+        Index(
+            "ix_weekly_reports_user_id_created_at",
+            "user_id",
+            text("created_at DESC"),
+            text("id DESC")
+        ),
+        # 같은 주 리포트 존재 여부/중복 요청 확인용 (재생성이 허용되므로 UNIQUE 아님)
+        Index(
+            "ix_weekly_reports_user_id_week",
+            "user_id",
+            "week_start",
+            "week_end"
+        ),
     )
     
     def __repr__(self) -> str:
@@ -73,3 +96,4 @@ class WeeklyReport(Base):
             "status": self.status or "completed",
             "created_at": self.created_at.isoformat(),
         }
+
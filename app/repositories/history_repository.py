@@ -2,9 +2,9 @@
 History 리포지토리 - 일기 데이터 조회
 """
 from datetime import date
-from typing import List, Optional
+from typing import List, Optional, Dict, Any
 from sqlalchemy.orm import Session
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, func
 
 from app.models.history import History
 
@@ -43,6 +43,49 @@ class HistoryRepository:
         result = self.db.execute(stmt)
         return list(result.scalars().all())
     
+    def get_entry_dicts_by_user_and_period(
+        self,
+        user_id: str,
+        start_date: date,
+        end_date: date
+    ) -> List[Dict[str, Any]]:
+        """
+        특정 사용자의 기간 내 일기 항목을 분석용 딕셔너리로 조회합니다.
+        ORM 객체를 만들지 않고 필요한 컬럼만 조회합니다.
+        
+        Args:
+            user_id: 사용자 ID (Cognito sub)
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+            
+        Returns:
+            id, content, record_date, tags 키를 가진 딕셔너리 목록
+        """
+        stmt = select(
+            History.id,
+            History.content,
+            History.record_date,
+            History.tags
+        ).where(
+            and_(
+                History.user_id == user_id,
+                History.record_date >= start_date,
+                History.record_date <= end_date
+            )
+        ).order_by(History.record_date).execution_options(yield_per=200)
+        
+        # 서버 측 커서로 200건씩 받아 긴 기간도 한 번에 버퍼링하지 않음
+        result = self.db.execute(stmt).mappings()
+        return [
+            {
+                "id": row["id"],
+                "content": row["content"],
+                "record_date": row["record_date"],
+                "tags": row["tags"] or []
+            }
+            for row in result
+        ]
+    
     def get_user_entries_count(
         self,
         user_id: str,
@@ -60,8 +103,15 @@ class HistoryRepository:
         Returns:
             일기 개수
         """
-        entries = self.get_entries_by_user_and_period(user_id, start_date, end_date)
-        return len(entries)
+        stmt = select(func.count()).select_from(History).where(
+            and_(
+                History.user_id == user_id,
+                History.record_date >= start_date,
+                History.record_date <= end_date
+            )
+        )
+        
+        return self.db.execute(stmt).scalar_one()
     
     def get_entry_by_id(self, entry_id: int) -> Optional[History]:
         """
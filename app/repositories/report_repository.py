@@ -3,8 +3,10 @@ Report 리포지토리 - 주간 리포트 CRUD
 """
 from datetime import date, datetime
 from typing import Optional, List, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import select, desc
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy.engine import Row
+from sqlalchemy import select, update, desc, or_, func, exists, tuple_
+from sqlalchemy.dialects.postgresql import JSONB
 
 from app.models.weekly_report import WeeklyReport
 
@@ -59,13 +61,12 @@ class ReportRepository:
             patterns=patterns,
             feedback=feedback,
             s3_key=s3_key,
-            status=status,
-            created_at=datetime.utcnow()
+            status=status
         )
         
+        # created_at은 컬럼 기본값으로 채워지고 id는 INSERT ... RETURNING으로 받으므로 commit 후 refresh 불필요
         self.db.add(report)
         self.db.commit()
-        self.db.refresh(report)
         
         return report
     
@@ -82,23 +83,20 @@ class ReportRepository:
     ) -> Optional[WeeklyReport]:
         """
         리포트를 업데이트합니다.
+        조회 없이 UPDATE ... RETURNING 한 번으로 처리합니다.
         """
-        report = self.get_report_by_id(report_id)
-        if not report:
-            return None
-        
-        report.average_score = average_score
-        report.evaluation = evaluation
-        report.daily_analysis = daily_analysis
-        report.patterns = patterns
-        report.feedback = feedback
-        report.status = status
+        values = {
+            "average_score": average_score,
+            "evaluation": evaluation,
+            "daily_analysis": daily_analysis,
+            "patterns": patterns,
+            "feedback": feedback,
+            "status": status,
+        }
         if s3_key:
-            report.s3_key = s3_key
+            values["s3_key"] = s3_key
         
-        self.db.commit()
-        self.db.refresh(report)
-        return report
+        return self._update_returning(report_id, values)
     
     def update_report_status(
         self,
@@ -109,16 +107,27 @@ class ReportRepository:
         """
         리포트 상태를 업데이트합니다.
         """
-        report = self.get_report_by_id(report_id)
-        if not report:
-            return None
-        
-        report.status = status
+        values: Dict[str, Any] = {"status": status}
         if error_message:
-            report.feedback = [error_message]
+            values["feedback"] = [error_message]
         
+        return self._update_returning(report_id, values)
+    
+    def _update_returning(
+        self,
+        report_id: int,
+        values: Dict[str, Any]
+    ) -> Optional[WeeklyReport]:
+        """UPDATE ... RETURNING으로 리포트를 수정하고 수정된 리포트를 반환합니다."""
+        stmt = (
+            update(WeeklyReport)
+            .where(WeeklyReport.id == report_id)
+            .values(**values)
+            .returning(WeeklyReport)
+        )
+        
+        report = self.db.execute(stmt).scalar_one_or_none()
         self.db.commit()
-        self.db.refresh(report)
         return report
     
     def get_latest_report_by_user(self, user_id: str) -> Optional[WeeklyReport]:
@@ -155,6 +164,36 @@ class ReportRepository:
         result = self.db.execute(stmt)
         return result.scalar_one_or_none()
     
+    def get_report_summary_by_nickname(self, nickname: str) -> Optional[Row]:
+        """
+        닉네임으로 가장 최근 리포트의 요약 컬럼만 조회합니다.
+        일별 분석 JSONB 전체 대신 일기 내용 배열만 DB에서 추출합니다.
+        
+        Args:
+            nickname: 닉네임
+            
+        Returns:
+            요약 행 (diary_contents 포함) 또는 None
+        """
+        stmt = select(
+            WeeklyReport.id,
+            WeeklyReport.nickname,
+            WeeklyReport.created_at,
+            WeeklyReport.average_score,
+            WeeklyReport.evaluation,
+            WeeklyReport.week_start,
+            WeeklyReport.week_end,
+            func.jsonb_path_query_array(
+                WeeklyReport.daily_analysis, "$[*].diary_content",
+                type_=JSONB
+            ).label("diary_contents")
+        ).where(
+            WeeklyReport.nickname == nickname
+        ).order_by(desc(WeeklyReport.created_at)).limit(1)
+        
+        result = self.db.execute(stmt)
+        return result.one_or_none()
+    
     def get_report_by_id(self, report_id: int) -> Optional[WeeklyReport]:
         """
         ID로 리포트를 조회합니다.
@@ -169,6 +208,27 @@ class ReportRepository:
         result = self.db.execute(stmt)
         return result.scalar_one_or_none()
     
+    def get_report_status_row(self, report_id: int) -> Optional[Row]:
+        """
+        리포트 상태 확인에 필요한 컬럼만 조회합니다.
+        JSONB 컬럼(daily_analysis, patterns, feedback)은 읽지 않습니다.
+        
+        Args:
+            report_id: 리포트 ID
+            
+        Returns:
+            (id, user_id, status, created_at) 행 또는 None
+        """
+        stmt = select(
+            WeeklyReport.id,
+            WeeklyReport.user_id,
+            WeeklyReport.status,
+            WeeklyReport.created_at
+        ).where(WeeklyReport.id == report_id)
+        
+        result = self.db.execute(stmt)
+        return result.one_or_none()
+    
     def get_reports_by_user(
         self,
         user_id: str,
@@ -176,21 +236,83 @@ class ReportRepository:
     ) -> List[WeeklyReport]:
         """
         사용자의 리포트 목록을 조회합니다.
+        애플리케이션 코드에서는 사용하지 않으며(목록 API는 get_report_summaries_by_user 사용) 테스트용으로만 유지합니다.
         
         Args:
             user_id: 사용자 ID
             limit: 최대 개수
             
         Returns:
-            리포트 목록
+            리포트 목록 (요약 컬럼만 로드됨, 제외된 컬럼에 접근하는 to_dict()는 예외 발생 - 전체 내용은 get_report_by_id 사용)
         """
-        stmt = select(WeeklyReport).where(
+        # 목록에는 큰 JSONB 컬럼(daily_analysis, patterns, feedback)이 필요 없으므로 제외
+        # 제외한 컬럼에 접근하면 행마다 지연 로딩(N+1)되지 않고 즉시 예외가 발생하도록 raiseload 사용
+        stmt = select(WeeklyReport).options(
+            load_only(
+                WeeklyReport.id,
+                WeeklyReport.user_id,
+                WeeklyReport.nickname,
+                WeeklyReport.week_start,
+                WeeklyReport.week_end,
+                WeeklyReport.average_score,
+                WeeklyReport.evaluation,
+                WeeklyReport.status,
+                WeeklyReport.created_at,
+                raiseload=True
+            )
+        ).where(
             WeeklyReport.user_id == user_id
         ).order_by(desc(WeeklyReport.created_at)).limit(limit)
         
         result = self.db.execute(stmt)
         return list(result.scalars().all())
     
+    def get_report_summaries_by_user(
+        self,
+        user_id: str,
+        limit: int = 10,
+        before: Optional[datetime] = None,
+        before_id: Optional[int] = None
+    ) -> List[Row]:
+        """
+        사용자의 리포트 목록을 목록 화면에 필요한 컬럼만 조회합니다.
+        (created_at, id) 기준 키셋 페이지네이션을 사용합니다.
+        
+        Args:
+            user_id: 사용자 ID
+            limit: 최대 개수
+            before: 이 시각 이전에 생성된 리포트만 조회 (다음 페이지 커서)
+            before_id: before와 created_at이 같은 리포트 중 이 ID보다 작은 것만 조회
+            
+        Returns:
+            리포트 요약 행 목록 (최신순)
+        """
+        stmt = select(
+            WeeklyReport.id,
+            WeeklyReport.user_id,
+            WeeklyReport.nickname,
+            WeeklyReport.week_start,
+            WeeklyReport.week_end,
+            WeeklyReport.average_score,
+            WeeklyReport.evaluation,
+            WeeklyReport.status,
+            WeeklyReport.created_at
+        ).where(WeeklyReport.user_id == user_id)
+        
+        if before is not None:
+            if before_id is not None:
+                # created_at이 같은 리포트가 페이지 경계에서 누락되지 않도록 id로 순서를 고정
+                stmt = stmt.where(
+                    tuple_(WeeklyReport.created_at, WeeklyReport.id) < tuple_(before, before_id)
+                )
+            else:
+                stmt = stmt.where(WeeklyReport.created_at < before)
+        
+        stmt = stmt.order_by(desc(WeeklyReport.created_at), desc(WeeklyReport.id)).limit(limit)
+        
+        result = self.db.execute(stmt)
+        return list(result.all())
+    
     def report_exists_for_week(
         self,
         user_id: str,
@@ -208,11 +330,47 @@ class ReportRepository:
         Returns:
             존재 여부
         """
+        # 행 전체(JSONB 포함)를 가져오지 않고 EXISTS로 불리언만 조회 (user_id/week 인덱스 사용)
+        stmt = select(
+            exists().where(
+                WeeklyReport.user_id == user_id,
+                WeeklyReport.week_start == week_start,
+                WeeklyReport.week_end == week_end
+            )
+        )
+        
+        return bool(self.db.execute(stmt).scalar())
+    
+    def get_recent_report_for_week(
+        self,
+        user_id: str,
+        week_start: date,
+        week_end: date,
+        since: datetime
+    ) -> Optional[WeeklyReport]:
+        """
+        해당 주에 최근 생성되었거나 생성 중인 리포트를 조회합니다.
+        실패한 리포트는 제외합니다.
+        
+        Args:
+            user_id: 사용자 ID
+            week_start: 주 시작일
+            week_end: 주 종료일
+            since: 이 시각 이후에 생성된 리포트만 조회
+            
+        Returns:
+            가장 최근 리포트 또는 None
+        """
         stmt = select(WeeklyReport).where(
             WeeklyReport.user_id == user_id,
             WeeklyReport.week_start == week_start,
-            WeeklyReport.week_end == week_end
-        ).limit(1)
+            WeeklyReport.week_end == week_end,
+            WeeklyReport.created_at >= since,
+            or_(
+                WeeklyReport.status.in_(("processing", "completed")),
+                WeeklyReport.status.is_(None)
+            )
+        ).order_by(desc(WeeklyReport.created_at)).limit(1)
         
         result = self.db.execute(stmt)
-        return result.scalar_one_or_none() is not None
+        return result.scalar_one_or_none()
@@ -1,12 +1,19 @@
 """
 User 리포지토리 - 사용자 데이터 조회
 """
+import threading
 from typing import Optional, List
+from cachetools import TTLCache
 from sqlalchemy.orm import Session
 from sqlalchemy import select
 
 from app.models.user import User
 
+# 사용자 행은 거의 바뀌지 않으므로 user_id 조회 결과를 잠시 캐시 (요청마다 DB 왕복 제거)
+USER_CACHE_TTL = 60
+_user_cache: TTLCache = TTLCache(maxsize=10000, ttl=USER_CACHE_TTL)
+_user_cache_lock = threading.Lock()
+
 
 class UserRepository:
     """사용자 데이터 리포지토리 (읽기 전용)"""
@@ -22,11 +29,24 @@ class UserRepository:
             user_id: 사용자 ID (Cognito sub)
             
         Returns:
-            사용자 또는 None
+            사용자 또는 None (캐시된 경우 세션에서 분리된 객체)
         """
+        with _user_cache_lock:
+            user = _user_cache.get(user_id)
+        if user is not None:
+            return user
+        
         stmt = select(User).where(User.user_id == user_id)
         result = self.db.execute(stmt)
-        return result.scalar_one_or_none()
+        user = result.scalar_one_or_none()
+        
+        # 신규 가입자가 바로 조회될 수 있도록 존재하는 사용자만 캐시
+        # 다른 세션/스레드에서 공유되므로 현재 세션에서 분리한 뒤 저장
+        if user is not None:
+            self.db.expunge(user)
+            with _user_cache_lock:
+                _user_cache[user_id] = user
+        return user
     
     def get_user_by_nickname(self, nickname: str) -> Optional[User]:
         """
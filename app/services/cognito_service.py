@@ -3,6 +3,7 @@ Cognito 서비스 - 사용자 인증 및 정보 조회
 """
 import boto3
 import httpx
+from botocore.config import Config
 from jose import jwt, JWTError
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
@@ -24,9 +25,15 @@ class CognitoService:
     
     def __init__(self):
         self.settings = get_settings()
+        # 인증 요청마다 TLS 핸드셰이크를 하지 않도록 커넥션 풀을 넉넉히 두고 keep-alive 유지
         self.client = boto3.client(
             "cognito-idp",
-            region_name=self.settings.AWS_REGION
+            region_name=self.settings.AWS_REGION,
+            config=Config(
+                retries={"mode": "adaptive", "max_attempts": 2},
+                max_pool_connections=50,
+                tcp_keepalive=True
+            )
         )
         self.user_pool_id = self.settings.get_cognito_user_pool_id()
         self.client_id = self.settings.get_cognito_client_id()
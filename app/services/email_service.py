@@ -3,6 +3,9 @@
 """
 import boto3
 import time
+import random
+from botocore.config import Config
+from botocore.exceptions import ClientError
 import logging
 from typing import Optional
 from functools import lru_cache
@@ -24,11 +27,28 @@ class EmailService:
     # SES는 도메인이 인증된 리전에서만 사용 가능
     SES_REGION = "ap-northeast-2"
     
+    # 재시도해도 결과가 같은 오류 (수신자/발신자/계정 설정 문제)
+    NON_RETRYABLE_ERROR_CODES = frozenset({
+        "MessageRejected",
+        "MailFromDomainNotVerifiedException",
+        "ConfigurationSetDoesNotExistException",
+        "AccountSendingPausedException",
+        "InvalidParameterValue",
+    })
+    
     def __init__(self):
         self.settings = get_settings()
         self.client = boto3.client(
             "ses",
-            region_name=self.SES_REGION  # SES는 도메인이 인증된 ap-northeast-2 사용
+            region_name=self.SES_REGION,  # SES는 도메인이 인증된 ap-northeast-2 사용
+            config=Config(
+                # send_report_notification이 직접 재시도하므로 botocore 재시도는 끔 (재시도 횟수 곱셈 방지)
+                retries={"mode": "standard", "total_max_attempts": 1},
+                connect_timeout=3,
+                read_timeout=10,
+                max_pool_connections=20,
+                tcp_keepalive=True
+            )
         )
         self.sender_email = self.settings.SES_SENDER_EMAIL
         self.api_base_url = self.settings.API_BASE_URL
@@ -133,9 +153,28 @@ class EmailService:
         Returns:
             발송 성공 여부
         """
-        retry_delays = [1, 2]
+        base_delay, max_delay = 1.0, 8.0
+        delay = base_delay
         last_error = None
         
+        # 메시지 본문은 재시도마다 다시 만들지 않음
+        message = {
+            "Subject": {
+                "Data": f"📊 {report.nickname}님의 주간 감정 분석이 완료되었습니다",
+                "Charset": "UTF-8"
+            },
+            "Body": {
+                "Text": {
+                    "Data": self._create_report_email_text(report),
+                    "Charset": "UTF-8"
+                },
+                "Html": {
+                    "Data": self._create_report_email_html(report),
+                    "Charset": "UTF-8"
+                }
+            }
+        }
+        
         for attempt in range(max_retries + 1):
             try:
                 response = self.client.send_email(
@@ -143,22 +182,7 @@ class EmailService:
                     Destination={
                         "ToAddresses": [recipient_email]
                     },
-                    Message={
-                        "Subject": {
-                            "Data": f"📊 {report.nickname}님의 주간 감정 분석이 완료되었습니다",
-                            "Charset": "UTF-8"
-                        },
-                        "Body": {
-                            "Text": {
-                                "Data": self._create_report_email_text(report),
-                                "Charset": "UTF-8"
-                            },
-                            "Html": {
-                                "Data": self._create_report_email_html(report),
-                                "Charset": "UTF-8"
-                            }
-                        }
-                    }
+                    Message=message
                 )
                 
                 logger.info(f"이메일 발송 성공: {recipient_email}, MessageId: {response.get('MessageId')}")
@@ -168,8 +192,16 @@ class EmailService:
                 last_error = e
                 logger.warning(f"이메일 발송 실패 (시도 {attempt + 1}/{max_retries + 1}): {e}")
                 
+                if (
+                    isinstance(e, ClientError)
+                    and e.response.get("Error", {}).get("Code") in self.NON_RETRYABLE_ERROR_CODES
+                ):
+                    break
+                
                 if attempt < max_retries:
-                    time.sleep(retry_delays[attempt])
+                    # decorrelated jitter: 동시에 실패한 작업들이 같은 시점에 재시도하지 않도록 분산
+                    delay = min(max_delay, random.uniform(base_delay, delay * 3))
+                    time.sleep(delay)
                 continue
         
         logger.error(f"이메일 발송 최종 실패: {recipient_email}, 에러: {last_error}")
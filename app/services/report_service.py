@@ -1,12 +1,18 @@
 """
 리포트 분석 서비스 - 주간 리포트 생성 및 분석
 """
+import re
 from datetime import date, datetime, timedelta
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, field, asdict
 from collections import defaultdict
+from functools import lru_cache
 
-from app.services.strands_service import SentimentAnalysis, DailyScore
+from app.services.strands_service import SentimentAnalysis, DailyScore, record_date_iso
+
+# 태그 유형 추론용 키워드 패턴 (한글 키워드라 대소문자 변환 불필요)
+WEATHER_KEYWORD_PATTERN = re.compile("맑음|흐림|비|눈|더움|추움|날씨")
+ACTIVITY_KEYWORD_PATTERN = re.compile("운동|산책|독서|영화|게임|요리|청소")
 
 
 @dataclass
@@ -148,9 +154,7 @@ class ReportAnalysisService:
         tag_scores: Dict[str, List[float]] = defaultdict(list)
         
         for entry in entries:
-            record_date = entry.get("record_date", "")
-            if isinstance(record_date, date):
-                record_date = record_date.isoformat()
+            record_date = record_date_iso(entry.get("record_date", ""))
             
             score = date_to_score.get(record_date, 5.0)
             tags = entry.get("tags") or []
@@ -186,19 +190,11 @@ class ReportAnalysisService:
     
     def _infer_tag_type(self, tag: str) -> str:
         """태그 유형을 추론합니다."""
-        weather_keywords = ["맑음", "흐림", "비", "눈", "더움", "추움", "날씨"]
-        activity_keywords = ["운동", "산책", "독서", "영화", "게임", "요리", "청소"]
-        
-        tag_lower = tag.lower()
-        
-        for keyword in weather_keywords:
-            if keyword in tag_lower:
-                return "weather"
-        
-        for keyword in activity_keywords:
-            if keyword in tag_lower:
-                return "activity"
-        
+        # 날씨 키워드를 활동 키워드보다 우선 적용
+        if WEATHER_KEYWORD_PATTERN.search(tag):
+            return "weather"
+        if ACTIVITY_KEYWORD_PATTERN.search(tag):
+            return "activity"
         return "experience"
     
     def extract_themes(
@@ -226,9 +222,7 @@ class ReportAnalysisService:
         relevant_entries = []
         
         for entry in entries:
-            record_date = entry.get("record_date", "")
-            if isinstance(record_date, date):
-                record_date = record_date.isoformat()
+            record_date = record_date_iso(entry.get("record_date", ""))
             
             score = date_to_score.get(record_date, 5.0)
             
@@ -392,9 +386,7 @@ class ReportAnalysisService:
         # 날짜별 일기 매핑
         date_to_entry = {}
         for entry in entries:
-            record_date = entry.get("record_date", "")
-            if isinstance(record_date, date):
-                record_date = record_date.isoformat()
+            record_date = record_date_iso(entry.get("record_date", ""))
             date_to_entry[record_date] = entry
         
         results = []
@@ -451,3 +443,9 @@ class ReportAnalysisService:
         last_sunday = last_monday + timedelta(days=6)
         
         return last_monday, last_sunday
+
+
+@lru_cache()
+def get_report_service() -> ReportAnalysisService:
+    """리포트 분석 서비스 싱글톤 인스턴스 반환"""
+    return ReportAnalysisService()
@@ -1,8 +1,12 @@
 """
 S3 서비스 - 리포트 파일 저장 및 조회
 """
+import io
 import boto3
+import gzip
 import logging
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from datetime import datetime
 from typing import Optional
 from functools import lru_cache
@@ -22,11 +26,28 @@ class S3Service:
     
     BUCKET_NAME = "fproject-s3-1234567"
     
+    # 이 크기를 넘는 리포트는 멀티파트로 나누어 병렬 업로드
+    MAX_SINGLE_UPLOAD_BYTES = 5 * 1024 * 1024
+    TRANSFER_CONFIG = TransferConfig(
+        multipart_threshold=MAX_SINGLE_UPLOAD_BYTES,
+        multipart_chunksize=MAX_SINGLE_UPLOAD_BYTES,
+        max_concurrency=4,
+        use_threads=True
+    )
+    
     def __init__(self):
         self.settings = get_settings()
         self.client = boto3.client(
             "s3",
-            region_name=self.settings.AWS_REGION
+            region_name=self.settings.AWS_REGION,
+            config=Config(
+                retries={"mode": "adaptive", "max_attempts": 5},
+                connect_timeout=3,
+                read_timeout=30,
+                # 스레드풀 엔드포인트와 멀티파트 업로드가 동시에 사용하므로 풀을 기본값(10)보다 크게 유지
+                max_pool_connections=50,
+                tcp_keepalive=True
+            )
         )
     
     def _generate_s3_key(self, user_id: str, created_at: datetime) -> str:
@@ -124,12 +145,24 @@ class S3Service:
             s3_key = self._generate_s3_key(user_id, created_at)
             content = self._format_report_content(report_data)
             
-            self.client.put_object(
-                Bucket=self.BUCKET_NAME,
-                Key=s3_key,
-                Body=content.encode('utf-8'),
-                ContentType='text/plain; charset=utf-8'
-            )
+            # presigned URL로 받은 파일을 curl/모바일 다운로드에서도 그대로 열 수 있도록 압축 없이 저장
+            body = content.encode('utf-8')
+            
+            if len(body) > self.MAX_SINGLE_UPLOAD_BYTES:
+                self.client.upload_fileobj(
+                    io.BytesIO(body),
+                    self.BUCKET_NAME,
+                    s3_key,
+                    ExtraArgs={'ContentType': 'text/plain; charset=utf-8'},
+                    Config=self.TRANSFER_CONFIG
+                )
+            else:
+                self.client.put_object(
+                    Bucket=self.BUCKET_NAME,
+                    Key=s3_key,
+                    Body=body,
+                    ContentType='text/plain; charset=utf-8'
+                )
             
             logger.info(f"리포트 업로드 완료: s3://{self.BUCKET_NAME}/{s3_key}")
             return s3_key
@@ -153,8 +186,11 @@ class S3Service:
                 Bucket=self.BUCKET_NAME,
                 Key=s3_key
             )
-            content = response['Body'].read().decode('utf-8')
-            return content
+            body = response['Body'].read()
+            # 이전에 gzip으로 저장된 리포트도 읽을 수 있도록 인코딩 확인
+            if response.get('ContentEncoding') == 'gzip':
+                body = gzip.decompress(body)
+            return body.decode('utf-8')
             
         except self.client.exceptions.NoSuchKey:
             raise S3ServiceError(f"리포트 파일을 찾을 수 없습니다: {s3_key}")
@@ -3,10 +3,12 @@
 감정 분석 서비스 - Fproject-agent API 호출
 Bedrock 직접 호출 대신 Fproject-agent의 /agent/report 엔드포인트를 사용
 """
-import json
 import re
+import time
+import random
 import logging
 import httpx
+import orjson
 from typing import Dict, Any, List
 from datetime import date
 from functools import lru_cache
@@ -19,6 +21,58 @@ logger = logging.getLogger(__name__)
 # Fproject-agent API 엔드포인트
 AGENT_API_URL = "https://api.aws11.shop/agent/report"
 
+# 응답에서 JSON 블록을 찾는 패턴 (모듈 로드 시 한 번만 컴파일)
+JSON_FENCE_PATTERN = re.compile(r'```json\s*([\s\S]*?)\s*```')
+JSON_OBJECT_PATTERN = re.compile(r'\{[\s\S]*"daily_analysis"[\s\S]*\}')
+
+# 사용자별 요청 본문 템플릿 (분석 지시문의 JSON 중괄호 때문에 format 대상에서 분리)
+ANALYSIS_TARGET_TEMPLATE = """
+{nickname}님의 일주일 일기를 분석해주세요.
+
+## 일기 내용
+{diary_text}
+
+"""
+
+# 분석 지시문 (일기 내용 뒤에 붙여 응답 형식 지시가 마지막에 오도록 함)
+ANALYSIS_INSTRUCTIONS = """## 분석 요청
+1. 각 일기의 감정 점수 (1-10점)
+2. 긍정적/부정적 패턴 식별
+3. 개인화된 피드백 제공
+
+응답은 반드시 JSON 형식으로 해주세요:
+{
+  "average_score": 6.5,
+  "evaluation": "positive",
+  "daily_analysis": [
+    {"date": "2026-01-13", "score": 7, "sentiment": "긍정적", "key_themes": ["테마1", "테마2"]}
+  ],
+  "patterns": [
+    {"type": "activity", "value": "활동명", "correlation": "positive"}
+  ],
+  "feedback": ["피드백1", "피드백2"]
+}
+"""
+
+# 기본 분석 결과의 안내 문구 (리포트 피드백으로 저장되어 메일로 발송됨)
+DEFAULT_RECOMMENDATION = "AI 분석 서비스에 일시적인 문제가 있습니다. 잠시 후 다시 시도해주세요."
+EMPTY_DIARY_RECOMMENDATION = "이번 주에는 분석할 일기 내용이 없습니다. 다음 주에는 하루의 감정을 일기로 남겨보세요."
+
+
+@lru_cache(maxsize=1024)
+def _date_isoformat(value: date) -> str:
+    return value.isoformat()
+
+
+def record_date_iso(record_date: Any) -> Any:
+    """
+    일기의 record_date를 ISO 문자열로 변환합니다.
+    같은 주의 날짜가 분석 단계마다 반복 변환되므로 date 객체의 변환 결과는 캐시합니다.
+    """
+    if isinstance(record_date, date):
+        return _date_isoformat(record_date)
+    return record_date
+
 
 class StrandsServiceError(Exception):
     """감정 분석 서비스 에러"""
@@ -50,6 +104,12 @@ class StrandsAgentService:
         self.settings = get_settings()
         self.api_url = AGENT_API_URL
         self.timeout = 120.0  # AI 분석에 시간이 걸릴 수 있으므로 타임아웃 늘림
+        # 요청마다 TCP/TLS 핸드셰이크를 하지 않도록 keep-alive 커넥션 풀 재사용
+        self.client = httpx.Client(
+            # 분석 응답(read)은 오래 기다리되, 연결 실패는 빨리 감지하여 재시도
+            timeout=httpx.Timeout(self.timeout, connect=5.0),
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+        )
     
     def analyze_sentiment(
         self,
@@ -63,40 +123,21 @@ class StrandsAgentService:
         일기 항목들의 감정을 분석합니다.
         Fproject-agent API를 호출하여 분석 수행
         """
-        # 일기 내용 포맷팅
-        diary_texts = []
-        for entry in entries:
-            record_date = entry.get("record_date", "")
-            if isinstance(record_date, date):
-                record_date = record_date.isoformat()
-            content = entry.get("content", "")
-            diary_texts.append(f"[{record_date}] {content}")
+        diary_text = self._format_diary_text(entries)
+        if not diary_text:
+            # 분석할 내용이 없으면 API를 호출하지 않음
+            logger.warning(f"분석할 일기 내용 없음: {nickname}")
+            return self._default_analysis(
+                entries,
+                sentiment="내용 없음",
+                recommendation=EMPTY_DIARY_RECOMMENDATION
+            )
         
         # API 요청 본문 구성
-        request_content = f"""
-{nickname}님의 일주일 일기를 분석해주세요.
-
-## 일기 내용
-{chr(10).join(diary_texts)}
-
-## 분석 요청
-1. 각 일기의 감정 점수 (1-10점)
-2. 긍정적/부정적 패턴 식별
-3. 개인화된 피드백 제공
-
-응답은 반드시 JSON 형식으로 해주세요:
-{{
-  "average_score": 6.5,
-  "evaluation": "positive",
-  "daily_analysis": [
-    {{"date": "2026-01-13", "score": 7, "sentiment": "긍정적", "key_themes": ["테마1", "테마2"]}}
-  ],
-  "patterns": [
-    {{"type": "activity", "value": "활동명", "correlation": "positive"}}
-  ],
-  "feedback": ["피드백1", "피드백2"]
-}}
-"""
+        request_content = ANALYSIS_TARGET_TEMPLATE.format(
+            nickname=nickname,
+            diary_text=diary_text
+        ) + ANALYSIS_INSTRUCTIONS
         
         request_body = {
             "content": request_content,
@@ -108,24 +149,16 @@ class StrandsAgentService:
         logger.info(f"Fproject-agent API 호출 시작: {nickname}, user_id={user_id}")
         
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.post(
-                    self.api_url,
-                    json=request_body,
-                    headers={"Content-Type": "application/json"}
-                )
-                response.raise_for_status()
-                
-                result = response.json()
-                logger.info(f"Fproject-agent API 응답: success={result.get('success')}")
+            result = self._post_with_retry(request_body)
+            logger.info(f"Fproject-agent API 응답: success={result.get('success')}")
+            
+            if result.get("success"):
+                # 응답에서 분석 결과 추출
+                return self._parse_agent_response(result.get("response", ""), entries)
+            else:
+                logger.error(f"Agent API 오류: {result.get('error')}")
+                return self._default_analysis(entries)
                 
-                if result.get("success"):
-                    # 응답에서 분석 결과 추출
-                    return self._parse_agent_response(result.get("response", ""), entries)
-                else:
-                    logger.error(f"Agent API 오류: {result.get('error')}")
-                    return self._default_analysis(entries)
-                    
         except httpx.TimeoutException:
             logger.error("Fproject-agent API 타임아웃")
             return self._default_analysis(entries)
@@ -136,6 +169,79 @@ class StrandsAgentService:
             logger.error(f"Fproject-agent API 호출 실패: {e}")
             return self._default_analysis(entries)
     
+    def _format_diary_text(self, entries: List[Dict[str, Any]]) -> str:
+        """
+        일기 항목들을 에이전트 입력 텍스트로 포맷팅합니다.
+        내용이 비어 있는 일기는 제외하고, 최대 길이를 넘으면 오래된 일기부터 제외합니다.
+        """
+        # 일기 내용 포맷팅 (entries는 record_date 오름차순)
+        lines = [
+            f"[{record_date_iso(entry.get('record_date', ''))}] {content}"
+            for entry in entries
+            if (content := (entry.get("content") or "").strip())
+        ]
+        
+        max_chars = self.settings.AGENT_MAX_INPUT_CHARS
+        total = sum(len(line) + 1 for line in lines)
+        start = 0
+        while total > max_chars and start < len(lines) - 1:
+            total -= len(lines[start]) + 1
+            start += 1
+        if start:
+            logger.info(f"입력 길이 제한으로 오래된 일기 {start}건 제외 (최대 {max_chars}자)")
+        
+        return "\n".join(lines[start:])
+    
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        """일시적인 오류인지 확인합니다 (연결 오류, 5xx, 429)."""
+        if isinstance(error, httpx.HTTPStatusError):
+            status_code = error.response.status_code
+            return status_code >= 500 or status_code == 429
+        # 읽기 타임아웃은 분석 자체가 오래 걸린 것이므로 재시도하지 않음
+        return isinstance(error, httpx.TransportError) and not isinstance(error, httpx.ReadTimeout)
+    
+    def _post_with_retry(
+        self,
+        request_body: Dict[str, Any],
+        max_retries: int = 2
+    ) -> Dict[str, Any]:
+        """
+        Fproject-agent API를 호출합니다. 일시적인 오류는 재시도합니다.
+        
+        Args:
+            request_body: 요청 본문
+            max_retries: 최대 재시도 횟수
+            
+        Returns:
+            API 응답 (JSON 파싱된 딕셔너리)
+        """
+        base_delay, max_delay = 0.5, 8.0
+        delay = base_delay
+        
+        for attempt in range(max_retries + 1):
+            try:
+                response = self.client.post(
+                    self.api_url,
+                    content=orjson.dumps(request_body),
+                    headers={"Content-Type": "application/json"}
+                )
+                response.raise_for_status()
+                
+                # JSON 응답만 파싱하고, 텍스트 응답은 파싱 시도 없이 그대로 분석 결과 추출 단계로 넘김
+                content_type = response.headers.get("content-type", "application/json")
+                if content_type.startswith("application/json"):
+                    return orjson.loads(response.content)
+                return {"success": True, "response": response.text}
+                
+            except (httpx.TransportError, httpx.HTTPStatusError) as e:
+                if attempt >= max_retries or not self._is_retryable(e):
+                    raise
+                logger.warning(f"Fproject-agent API 호출 실패 (시도 {attempt + 1}/{max_retries + 1}): {e}")
+                # decorrelated jitter: 동시에 실패한 작업들이 같은 시점에 재시도하지 않도록 분산
+                delay = min(max_delay, random.uniform(base_delay, delay * 3))
+                time.sleep(delay)
+    
     def _parse_agent_response(
         self,
         response: str,
@@ -145,15 +251,15 @@ class StrandsAgentService:
         
         try:
             # JSON 블록 추출 시도
-            json_match = re.search(r'```json\s*([\s\S]*?)\s*```', response)
+            json_match = JSON_FENCE_PATTERN.search(response)
             if json_match:
                 json_str = json_match.group(1)
-                data = json.loads(json_str)
+                data = orjson.loads(json_str)
             else:
                 # ```json 없이 직접 JSON 찾기
-                json_match = re.search(r'\{[\s\S]*"daily_analysis"[\s\S]*\}', response)
+                json_match = JSON_OBJECT_PATTERN.search(response)
                 if json_match:
-                    data = json.loads(json_match.group())
+                    data = orjson.loads(json_match.group())
                 else:
                     # JSON이 없으면 텍스트 응답에서 정보 추출 시도
                     logger.warning("JSON 형식 응답 없음, 기본 분석 사용")
@@ -186,29 +292,32 @@ class StrandsAgentService:
                 recommendations=data.get("feedback", [])
             )
             
-        except (json.JSONDecodeError, KeyError) as e:
+        except (orjson.JSONDecodeError, KeyError) as e:
             logger.error(f"응답 파싱 실패: {e}")
             return self._default_analysis(entries)
     
-    def _default_analysis(self, entries: List[Dict[str, Any]]) -> SentimentAnalysis:
-        """기본 분석 결과 반환 (API 실패 시)"""
-        daily_scores = []
-        for entry in entries:
-            record_date = entry.get("record_date", "")
-            if isinstance(record_date, date):
-                record_date = record_date.isoformat()
-            daily_scores.append(DailyScore(
-                date=record_date,
+    def _default_analysis(
+        self,
+        entries: List[Dict[str, Any]],
+        sentiment: str = "분석 대기",
+        recommendation: str = DEFAULT_RECOMMENDATION
+    ) -> SentimentAnalysis:
+        """기본 분석 결과 반환 (API 실패 또는 분석할 일기 내용이 없을 때)"""
+        daily_scores = [
+            DailyScore(
+                date=record_date_iso(entry.get("record_date", "")),
                 score=5.0,
-                sentiment="분석 대기",
+                sentiment=sentiment,
                 key_themes=entry.get("tags", []) or []
-            ))
+            )
+            for entry in entries
+        ]
         
         return SentimentAnalysis(
             daily_scores=daily_scores,
             positive_patterns=[],
             negative_patterns=[],
-            recommendations=["AI 분석 서비스에 일시적인 문제가 있습니다. 잠시 후 다시 시도해주세요."]
+            recommendations=[recommendation]
         )
 
 
@@ -0,0 +1,16 @@
+-- weekly_reports 조회용 인덱스 (app/models/weekly_report.py의 __table_args__와 동일하게 유지)
+-- CONCURRENTLY는 트랜잭션 블록 안에서 실행할 수 없으므로 psql로 파일을 그대로 실행합니다.
+--   psql "host=$DB_HOST dbname=$DB_NAME user=$DB_USER" -f infra/weekly-reports-indexes.sql
+-- 생성이 중간에 실패하면 INVALID 인덱스가 남으므로 DROP INDEX CONCURRENTLY 후 다시 실행합니다.
+
+-- 닉네임 검색 시 최신 리포트 1건 조회
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_weekly_reports_nickname_created_at
+    ON weekly_reports (nickname, created_at DESC);
+
+-- 사용자별 리포트 목록 (최신순, (created_at, id) 키셋 페이지네이션)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_weekly_reports_user_id_created_at
+    ON weekly_reports (user_id, created_at DESC, id DESC);
+
+-- 같은 주 리포트 존재 여부 / 중복 요청 확인 (재생성이 허용되므로 UNIQUE 아님)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_weekly_reports_user_id_week
+    ON weekly_reports (user_id, week_start, week_end);
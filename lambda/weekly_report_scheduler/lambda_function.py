@@ -7,7 +7,9 @@ import json
 import logging
 import urllib.request
 import urllib.error
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
@@ -17,6 +19,22 @@ KST = timezone(timedelta(hours=9))
 
 API_ENDPOINT = os.environ.get("API_ENDPOINT", "https://api.aws11.shop")
 
+# 사용자별 처리(존재 확인 + 생성 요청)를 동시에 수행할 최대 개수
+REPORT_CONCURRENCY_LIMIT = int(os.environ.get("REPORT_CONCURRENCY_LIMIT", "4"))
+
+
+@lru_cache(maxsize=1)
+def get_lambda_client():
+    """QueryDatabase 호출용 Lambda 클라이언트 (컨테이너 재사용 시에도 1회만 생성)"""
+    import boto3
+    from botocore.config import Config
+    
+    return boto3.client(
+        'lambda',
+        region_name='ap-northeast-2',
+        config=Config(retries={"mode": "adaptive", "max_attempts": 5}, tcp_keepalive=True)
+    )
+
 
 def get_previous_week_range() -> tuple:
     """지난 주의 시작일(월요일)과 종료일(일요일)을 한국 시간 기준으로 반환합니다."""
@@ -30,8 +48,6 @@ def get_previous_week_range() -> tuple:
 
 def get_users_with_entries(week_start, week_end) -> list:
     """QueryDatabase Lambda를 통해 해당 기간에 일기가 있는 유저 목록 조회"""
-    import boto3
-    
     query = f"""
         SELECT DISTINCT u.user_id, u.email, u.nickname
         FROM users u
@@ -40,8 +56,7 @@ def get_users_with_entries(week_start, week_end) -> list:
         AND u.deleted_at IS NULL
     """
     
-    client = boto3.client('lambda', region_name='ap-northeast-2')
-    response = client.invoke(
+    response = get_lambda_client().invoke(
         FunctionName='QueryDatabase',
         InvocationType='RequestResponse',
         Payload=json.dumps({"query": query})
@@ -57,16 +72,13 @@ def get_users_with_entries(week_start, week_end) -> list:
 
 def check_report_exists(user_id: str, week_start, week_end) -> bool:
     """해당 주에 이미 리포트가 존재하는지 확인"""
-    import boto3
-    
     query = f"""
         SELECT 1 FROM weekly_reports
         WHERE user_id = '{user_id}' AND week_start = '{week_start}' AND week_end = '{week_end}'
         LIMIT 1
     """
     
-    client = boto3.client('lambda', region_name='ap-northeast-2')
-    response = client.invoke(
+    response = get_lambda_client().invoke(
         FunctionName='QueryDatabase',
         InvocationType='RequestResponse',
         Payload=json.dumps({"query": query})
@@ -96,6 +108,24 @@ def invoke_report_generation(user_id: str, week_start, week_end) -> dict:
         return {"success": False, "user_id": user_id, "error": str(e)}
 
 
+def process_user(user: dict, week_start, week_end) -> tuple:
+    """
+    한 사용자의 리포트 생성을 처리합니다.
+    
+    Returns:
+        ("skip" | "success" | "error", 에러 메시지 또는 None)
+    """
+    user_id = user["user_id"]
+    
+    if check_report_exists(user_id, week_start, week_end):
+        return "skip", None
+    
+    result = invoke_report_generation(user_id, week_start, week_end)
+    if result.get("success"):
+        return "success", None
+    return "error", result.get("error")
+
+
 def lambda_handler(event, context):
     logger.info(f"주간 리포트 스케줄러 시작: {event}")
     
@@ -109,30 +139,34 @@ def lambda_handler(event, context):
         results["total_users"] = len(users)
         logger.info(f"적격 사용자 수: {len(users)}")
         
-        for user in users:
-            user_id = user["user_id"]
-            nickname = user.get("nickname", "Unknown")
+        # 사용자별 처리는 서로 독립적인 네트워크 I/O이므로 병렬로 실행하고,
+        # 결과 집계는 메인 스레드에서만 수행
+        with ThreadPoolExecutor(max_workers=REPORT_CONCURRENCY_LIMIT) as executor:
+            futures = {
+                executor.submit(process_user, user, week_start, week_end): user
+                for user in users
+            }
             
-            try:
-                if check_report_exists(user_id, week_start, week_end):
-                    logger.info(f"사용자 {nickname}: 이미 리포트 존재, 건너뜀")
-                    results["skip_count"] += 1
-                    continue
+            for future in as_completed(futures):
+                user = futures[future]
+                user_id = user["user_id"]
+                nickname = user.get("nickname", "Unknown")
                 
-                result = invoke_report_generation(user_id, week_start, week_end)
+                try:
+                    outcome, error = future.result()
+                except Exception as e:
+                    outcome, error = "error", str(e)
                 
-                if result.get("success"):
+                if outcome == "skip":
+                    logger.info(f"사용자 {nickname}: 이미 리포트 존재, 건너뜀")
+                    results["skip_count"] += 1
+                elif outcome == "success":
                     logger.info(f"사용자 {nickname}: 리포트 생성 요청 성공")
                     results["success_count"] += 1
                 else:
-                    logger.error(f"사용자 {nickname}: 리포트 생성 실패 - {result.get('error')}")
+                    logger.error(f"사용자 {nickname}: 리포트 생성 실패 - {error}")
                     results["error_count"] += 1
-                    results["errors"].append({"user_id": user_id, "error": result.get("error")})
-                    
-            except Exception as e:
-                logger.error(f"사용자 {nickname}: 처리 중 오류 - {e}")
-                results["error_count"] += 1
-                results["errors"].append({"user_id": user_id, "error": str(e)})
+                    results["errors"].append({"user_id": user_id, "error": error})
                 
     except Exception as e:
         logger.error(f"스케줄러 실행 중 오류: {e}")
@@ -0,0 +1,128 @@
+"""
+리포트 파일 엔드포인트 캐시 테스트
+"""
+import pytest
+from datetime import date, datetime
+from unittest.mock import MagicMock
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.endpoints import report as report_endpoint
+from app.config.database import get_db
+from app.models.weekly_report import WeeklyReport
+from app.services.s3_service import get_s3_service
+
+
+SHARED_S3_KEY = "user-123/report/2025/01/report_2025-01-20.txt"
+
+
+def _make_report(report_id: int) -> WeeklyReport:
+    """같은 날 생성되어 S3 키가 같은 완료 리포트"""
+    return WeeklyReport(
+        id=report_id,
+        user_id="user-123",
+        nickname="테스트",
+        week_start=date(2025, 1, 13),
+        week_end=date(2025, 1, 19),
+        average_score=7.0,
+        evaluation="positive",
+        daily_analysis=[],
+        patterns=[],
+        feedback=[],
+        s3_key=SHARED_S3_KEY,
+        status="completed",
+        created_at=datetime(2025, 1, 20, 9, report_id),
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """테스트 간 모듈 캐시 초기화"""
+    report_endpoint._completed_report_cache.clear()
+    report_endpoint._report_file_cache.clear()
+    yield
+    report_endpoint._completed_report_cache.clear()
+    report_endpoint._report_file_cache.clear()
+
+
+@pytest.fixture
+def s3_service():
+    service = MagicMock()
+    service.get_report.side_effect = ["리포트 1 내용", "리포트 2 내용"]
+    return service
+
+
+@pytest.fixture
+def client(monkeypatch, s3_service):
+    reports = {1: _make_report(1), 2: _make_report(2)}
+    monkeypatch.setattr(
+        report_endpoint.ReportRepository,
+        "get_report_by_id",
+        lambda self, report_id: reports.get(report_id),
+    )
+
+    app = FastAPI()
+    app.include_router(report_endpoint.router, prefix="/report")
+    app.dependency_overrides[get_db] = lambda: None
+    app.dependency_overrides[get_s3_service] = lambda: s3_service
+    return TestClient(app)
+
+
+def test_file_cache_is_per_report(client, s3_service):
+    """S3 키가 같아도 리포트마다 자기 파일 내용을 반환"""
+    first = client.get("/report/1/file", params={"user_id": "user-123"})
+    second = client.get("/report/2/file", params={"user_id": "user-123"})
+
+    assert first.status_code == 200
+    assert first.json()["content"] == "리포트 1 내용"
+    assert second.status_code == 200
+    assert second.json()["content"] == "리포트 2 내용"
+    assert s3_service.get_report.call_count == 2
+
+
+def test_file_content_served_from_cache(client, s3_service):
+    """같은 리포트를 다시 조회하면 S3를 호출하지 않음"""
+    client.get("/report/1/file", params={"user_id": "user-123"})
+    again = client.get("/report/1/file", params={"user_id": "user-123"})
+
+    assert again.json()["content"] == "리포트 1 내용"
+    assert s3_service.get_report.call_count == 1
+
+
+def test_file_not_modified_with_matching_etag(client, s3_service):
+    """ETag가 일치하면 본문 없이 304 반환"""
+    first = client.get("/report/1/file", params={"user_id": "user-123"})
+    etag = first.headers["ETag"]
+
+    cached = client.get(
+        "/report/1/file",
+        params={"user_id": "user-123"},
+        headers={"If-None-Match": etag},
+    )
+
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == etag
+    assert cached.content == b""
+    assert s3_service.get_report.call_count == 1
+
+
+def test_file_etag_differs_per_report(client):
+    """다른 리포트의 ETag로는 304가 반환되지 않음"""
+    first = client.get("/report/1/file", params={"user_id": "user-123"})
+
+    other = client.get(
+        "/report/2/file",
+        params={"user_id": "user-123"},
+        headers={"If-None-Match": first.headers["ETag"]},
+    )
+
+    assert other.status_code == 200
+    assert other.json()["content"] == "리포트 2 내용"
+
+
+def test_file_forbidden_for_other_user(client, s3_service):
+    """다른 사용자의 리포트 파일은 조회할 수 없음"""
+    response = client.get("/report/1/file", params={"user_id": "other-user"})
+
+    assert response.status_code == 403
+    s3_service.get_report.assert_not_called()
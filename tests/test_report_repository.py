@@ -2,16 +2,24 @@
 ReportRepository 테스트
 """
 import pytest
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from sqlalchemy import create_engine
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
-from app.models.base import Base
 from app.models.weekly_report import WeeklyReport
 from app.repositories.report_repository import ReportRepository
 
 
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_sqlite(type_, compiler, **kw):
+    """SQLite에는 JSONB가 없으므로 JSON으로 생성"""
+    return "JSON"
+
+
 @pytest.fixture(scope="function")
 def test_db():
     """테스트용 인메모리 SQLite 데이터베이스"""
@@ -20,7 +28,8 @@ def test_db():
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
-    Base.metadata.create_all(bind=engine)
+    # histories(ARRAY) 등 SQLite에서 생성할 수 없는 테이블은 제외하고 리포트 테이블만 생성
+    WeeklyReport.__table__.create(bind=engine)
     TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
     
     db = TestSessionLocal()
@@ -28,7 +37,7 @@ def test_db():
         yield db
     finally:
         db.close()
-        Base.metadata.drop_all(bind=engine)
+        WeeklyReport.__table__.drop(bind=engine)
 
 
 @pytest.fixture
@@ -109,6 +118,18 @@ class TestReportRepository:
         assert found is not None
         assert found.nickname == "테스트유저"
     
+    def test_get_report_status_row(self, report_repo, sample_report_data):
+        """상태 조회용 컬럼만 조회 테스트"""
+        saved = report_repo.save_report(**sample_report_data)
+        
+        row = report_repo.get_report_status_row(saved.id)
+        assert row is not None
+        assert row.id == saved.id
+        assert row.user_id == sample_report_data["user_id"]
+        assert row.status == "completed"
+        
+        assert report_repo.get_report_status_row(99999) is None
+    
     def test_get_reports_by_user(self, report_repo, sample_report_data):
         """사용자의 리포트 목록 조회"""
         # 여러 리포트 저장
@@ -121,16 +142,60 @@ class TestReportRepository:
         reports = report_repo.get_reports_by_user("test-user-123")
         assert len(reports) == 2
     
+    def test_get_reports_by_user_skips_analysis_columns(self, report_repo, sample_report_data):
+        """리포트 목록은 JSONB 분석 컬럼을 로드하지 않고, 접근 시 지연 로딩 대신 예외 발생"""
+        report_repo.save_report(**sample_report_data)
+        report_repo.db.expunge_all()
+        
+        report = report_repo.get_reports_by_user("test-user-123")[0]
+        assert report.evaluation == "positive"
+        with pytest.raises(InvalidRequestError):
+            report.daily_analysis
+    
     def test_get_reports_by_user_with_limit(self, report_repo, sample_report_data):
         """리포트 목록 조회 (limit)"""
         for i in range(5):
-            sample_report_data["week_start"] = date(2025, 1, 13 + i * 7)
-            sample_report_data["week_end"] = date(2025, 1, 19 + i * 7)
+            sample_report_data["week_start"] = date(2025, 1, 13) + timedelta(weeks=i)
+            sample_report_data["week_end"] = date(2025, 1, 19) + timedelta(weeks=i)
             report_repo.save_report(**sample_report_data)
         
         reports = report_repo.get_reports_by_user("test-user-123", limit=3)
         assert len(reports) == 3
     
+    def test_get_report_summaries_by_user(self, report_repo, sample_report_data):
+        """리포트 요약 목록 조회 (키셋 페이지네이션)"""
+        report_repo.save_report(**sample_report_data)
+        sample_report_data["week_start"] = date(2025, 1, 20)
+        sample_report_data["week_end"] = date(2025, 1, 26)
+        report_repo.save_report(**sample_report_data)
+        
+        first_page = report_repo.get_report_summaries_by_user("test-user-123", limit=1)
+        assert len(first_page) == 1
+        
+        second_page = report_repo.get_report_summaries_by_user(
+            "test-user-123", limit=1, before=first_page[0].created_at
+        )
+        assert len(second_page) == 1
+        assert second_page[0].id != first_page[0].id
+    
+    def test_get_report_summaries_by_user_same_created_at(self, report_repo, sample_report_data):
+        """created_at이 같은 리포트도 페이지 경계에서 누락되지 않음"""
+        first = report_repo.save_report(**sample_report_data)
+        sample_report_data["week_start"] = date(2025, 1, 20)
+        sample_report_data["week_end"] = date(2025, 1, 26)
+        second = report_repo.save_report(**sample_report_data)
+        
+        second.created_at = first.created_at
+        report_repo.db.commit()
+        
+        first_page = report_repo.get_report_summaries_by_user("test-user-123", limit=1)
+        second_page = report_repo.get_report_summaries_by_user(
+            "test-user-123", limit=1,
+            before=first_page[0].created_at, before_id=first_page[0].id
+        )
+        assert first_page[0].id == second.id
+        assert [r.id for r in second_page] == [first.id]
+    
     def test_report_exists_for_week(self, report_repo, sample_report_data):
         """해당 주 리포트 존재 여부 확인"""
         report_repo.save_report(**sample_report_data)
@@ -149,6 +214,25 @@ class TestReportRepository:
         )
         assert not_exists is False
     
+    def test_get_recent_report_for_week(self, report_repo, sample_report_data):
+        """최근 생성된(또는 생성 중인) 같은 주 리포트 조회"""
+        sample_report_data["status"] = "processing"
+        saved = report_repo.save_report(**sample_report_data)
+        since = datetime.utcnow() - timedelta(minutes=10)
+        
+        found = report_repo.get_recent_report_for_week(
+            "test-user-123", date(2025, 1, 13), date(2025, 1, 19), since
+        )
+        assert found is not None
+        assert found.id == saved.id
+        
+        # 실패한 리포트는 중복으로 보지 않음
+        report_repo.update_report_status(saved.id, "failed")
+        found = report_repo.get_recent_report_for_week(
+            "test-user-123", date(2025, 1, 13), date(2025, 1, 19), since
+        )
+        assert found is None
+    
     def test_update_report(self, report_repo, sample_report_data):
         """리포트 업데이트 테스트"""
         saved = report_repo.save_report(**sample_report_data)
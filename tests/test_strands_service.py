@@ -0,0 +1,180 @@
+"""
+StrandsAgentService 테스트
+"""
+import httpx
+import pytest
+from datetime import date
+from app.services import strands_service
+from app.services.strands_service import (
+    StrandsAgentService,
+    EMPTY_DIARY_RECOMMENDATION,
+)
+
+
+@pytest.fixture
+def service():
+    return StrandsAgentService()
+
+
+class TestFormatDiaryText:
+    """_format_diary_text 테스트"""
+
+    def test_blank_entries_dropped(self, service):
+        """내용이 비어 있는 일기는 제외"""
+        entries = [
+            {"content": "운동을 했다.", "record_date": date(2025, 1, 13)},
+            {"content": "   ", "record_date": date(2025, 1, 14)},
+            {"content": None, "record_date": date(2025, 1, 15)},
+            {"content": " 책을 읽었다. ", "record_date": date(2025, 1, 16)},
+        ]
+
+        text = service._format_diary_text(entries)
+
+        assert text == "[2025-01-13] 운동을 했다.\n[2025-01-16] 책을 읽었다."
+
+    def test_all_blank_entries(self, service):
+        """모든 일기가 비어 있으면 빈 문자열"""
+        entries = [{"content": "", "record_date": date(2025, 1, 13)}]
+
+        assert service._format_diary_text(entries) == ""
+
+    def test_oldest_entries_dropped_first(self, service, monkeypatch):
+        """최대 길이를 넘으면 오래된 일기부터 제외"""
+        entries = [
+            {"content": "가" * 10, "record_date": date(2025, 1, 13)},
+            {"content": "나" * 10, "record_date": date(2025, 1, 14)},
+            {"content": "다" * 10, "record_date": date(2025, 1, 15)},
+        ]
+        # 각 줄은 "[YYYY-MM-DD] " 13자 + 내용 10자 = 23자 (+ 줄바꿈 1자)
+        monkeypatch.setattr(service.settings, "AGENT_MAX_INPUT_CHARS", 48)
+
+        text = service._format_diary_text(entries)
+
+        assert text == "[2025-01-14] " + "나" * 10 + "\n[2025-01-15] " + "다" * 10
+
+    def test_newest_entry_always_kept(self, service, monkeypatch):
+        """가장 최근 일기는 최대 길이를 넘어도 유지"""
+        entries = [
+            {"content": "가" * 10, "record_date": date(2025, 1, 13)},
+            {"content": "나" * 100, "record_date": date(2025, 1, 14)},
+        ]
+        monkeypatch.setattr(service.settings, "AGENT_MAX_INPUT_CHARS", 10)
+
+        text = service._format_diary_text(entries)
+
+        assert text == "[2025-01-14] " + "나" * 100
+
+
+class TestAnalyzeSentiment:
+    """analyze_sentiment 테스트"""
+
+    def test_empty_diaries_skip_api(self, service, monkeypatch):
+        """분석할 내용이 없으면 API를 호출하지 않고 안내 문구 반환"""
+        def fail_post(*args, **kwargs):
+            raise AssertionError("API가 호출되면 안 됨")
+        monkeypatch.setattr(service, "_post_with_retry", fail_post)
+        entries = [{"content": " ", "record_date": date(2025, 1, 13), "tags": ["운동"]}]
+
+        analysis = service.analyze_sentiment(entries, "테스트")
+
+        assert analysis.recommendations == [EMPTY_DIARY_RECOMMENDATION]
+        assert analysis.daily_scores[0].date == "2025-01-13"
+        assert analysis.daily_scores[0].key_themes == ["운동"]
+
+
+class TestPostWithRetry:
+    """_post_with_retry / _is_retryable 테스트"""
+
+    @pytest.fixture
+    def sleeps(self, monkeypatch):
+        """재시도 대기 시간을 기록하고 실제로는 기다리지 않음"""
+        recorded = []
+        monkeypatch.setattr(strands_service.time, "sleep", recorded.append)
+        return recorded
+
+    @staticmethod
+    def _use_responses(service, responses):
+        """요청마다 responses를 차례로 반환(또는 예외 발생)하는 MockTransport 설정"""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            result = responses[len(calls) - 1]
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        service.client = httpx.Client(transport=httpx.MockTransport(handler))
+        return calls
+
+    @pytest.mark.parametrize("status_code", [500, 502, 503, 429])
+    def test_retries_server_errors_and_throttling(self, service, sleeps, status_code):
+        """5xx/429는 재시도 후 성공"""
+        calls = self._use_responses(service, [
+            httpx.Response(status_code),
+            httpx.Response(200, json={"success": True, "response": "ok"}),
+        ])
+
+        result = service._post_with_retry({"content": "x"})
+
+        assert result == {"success": True, "response": "ok"}
+        assert len(calls) == 2
+        assert len(sleeps) == 1
+
+    def test_retries_connect_error(self, service, sleeps):
+        """연결 오류는 재시도"""
+        calls = self._use_responses(service, [
+            httpx.ConnectError("connection refused"),
+            httpx.Response(200, json={"success": True, "response": "ok"}),
+        ])
+
+        assert service._post_with_retry({"content": "x"})["success"] is True
+        assert len(calls) == 2
+
+    @pytest.mark.parametrize("status_code", [400, 401, 404, 422])
+    def test_client_errors_not_retried(self, service, sleeps, status_code):
+        """4xx(429 제외)는 재시도하지 않음"""
+        calls = self._use_responses(service, [httpx.Response(status_code)])
+
+        with pytest.raises(httpx.HTTPStatusError):
+            service._post_with_retry({"content": "x"})
+        assert len(calls) == 1
+        assert sleeps == []
+
+    def test_read_timeout_not_retried(self, service, sleeps):
+        """읽기 타임아웃은 재시도하지 않음"""
+        calls = self._use_responses(service, [httpx.ReadTimeout("timed out")])
+
+        with pytest.raises(httpx.ReadTimeout):
+            service._post_with_retry({"content": "x"})
+        assert len(calls) == 1
+        assert sleeps == []
+
+    def test_gives_up_after_max_retries(self, service, sleeps):
+        """최대 재시도 횟수를 넘으면 마지막 오류를 그대로 발생"""
+        calls = self._use_responses(service, [httpx.Response(503)] * 3)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            service._post_with_retry({"content": "x"}, max_retries=2)
+        assert len(calls) == 3
+        assert len(sleeps) == 2
+        assert all(0.5 <= delay <= 8.0 for delay in sleeps)
+
+    def test_json_response_parsed(self, service, sleeps):
+        """JSON 응답은 파싱하여 반환"""
+        self._use_responses(service, [
+            httpx.Response(200, json={"success": False, "error": "bad"}),
+        ])
+
+        assert service._post_with_retry({"content": "x"}) == {"success": False, "error": "bad"}
+
+    def test_text_response_passed_through(self, service, sleeps):
+        """텍스트 응답은 파싱 없이 분석 결과 추출 단계로 전달"""
+        self._use_responses(service, [
+            httpx.Response(200, text="```json\n{}\n```", headers={"content-type": "text/plain"}),
+        ])
+
+        assert service._post_with_retry({"content": "x"}) == {
+            "success": True,
+            "response": "```json\n{}\n```",
+        }